@@ -13,29 +13,88 @@
 # limitations under the License.
 
 import hashlib
-import json
-from typing import Any, Dict, List, Union
+import os
+import stat
+import tempfile
+import orjson
+from typing import Any, Dict, Iterable, List, Union
 
 
-def calculate_sha1(file: Any) -> str:
+HASH_CHUNK_SIZE = 4 << 20
+JSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+# 导入时读取进程 umask，新建 JSON 文件的权限与直接 open() 创建时一致
+_PROCESS_UMASK = os.umask(0)
+os.umask(_PROCESS_UMASK)
+NEW_FILE_MODE = 0o666 & ~_PROCESS_UMASK
+
+
+def _digest_file(file: Any, algorithm: str) -> str:
     """
-    计算文件的 SHA-1 哈希值。
+    使用指定算法计算文件的哈希值。
+
+    支持文件路径与文件对象两种输入：对于支持 `readinto` 的二进制文件对象使用
+    `hashlib.file_digest`，由 C 层完成读取与摘要计算；否则按 4 MiB 分块读取。
 
     Args:
-        file (file-like object): 要计算哈希值的文件对象。该对象应该支持 `read` 方法。
+        file (str or file-like object): 文件路径，或支持 `read` 方法的文件对象。
+        algorithm (str): hashlib 支持的哈希算法名称，例如 "sha1"、"md5"。
 
     Returns:
-        str: 文件的 SHA-1 哈希值（以十六进制字符串形式表示）。
+        str: 文件的哈希值（以十六进制字符串形式表示）。
     """
 
-    sha1 = hashlib.sha1()
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with open(file, "rb") as f:
+            _advise_sequential_read(f)
+            return hashlib.file_digest(f, algorithm).hexdigest()
 
-    chunk = file.read(8192)
+    if hasattr(file, "getbuffer") or (hasattr(file, "readinto") and hasattr(file, "readable") and file.readable()):
+        _advise_sequential_read(file)
+        return hashlib.file_digest(file, algorithm).hexdigest()
+
+    digest = hashlib.new(algorithm)
+    chunk = file.read(HASH_CHUNK_SIZE)
     while chunk:
-        sha1.update(chunk)
-        chunk = file.read(8192)
+        digest.update(chunk)
+        chunk = file.read(HASH_CHUNK_SIZE)
+
+    return digest.hexdigest()
 
-    return sha1.hexdigest()
+
+def _advise_sequential_read(file: Any) -> None:
+    """
+    提示内核将按顺序读取整个文件，以便加大预读窗口。
+
+    仅对带有真实文件描述符的对象生效；内存缓冲区、归档成员等对象或不支持
+    `posix_fadvise` 的平台直接跳过。
+
+    Args:
+        file (file-like object): 要读取的文件对象。
+
+    Returns:
+        None
+    """
+
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError, ValueError):
+        pass
+
+
+def calculate_sha1(file: Any) -> str:
+    """
+    计算文件的 SHA-1 哈希值。
+
+    Args:
+        file (str or file-like object): 要计算哈希值的文件路径或文件对象。文件对象应该支持 `read` 方法。
+
+    Returns:
+        str: 文件的 SHA-1 哈希值（以十六进制字符串形式表示）。
+    """
+
+    return _digest_file(file, "sha1")
 
 
 def calculate_md5(file: Any) -> str:
@@ -43,20 +102,29 @@ def calculate_md5(file: Any) -> str:
     计算文件的 MD5 哈希值。
 
     Args:
-        file (file-like object): 要计算哈希值的文件对象。该对象应该支持 `read` 方法。
+        file (str or file-like object): 要计算哈希值的文件路径或文件对象。文件对象应该支持 `read` 方法。
 
     Returns:
         str: 文件的 MD5 哈希值（以十六进制字符串形式表示）。
     """
 
-    md5 = hashlib.md5()
+    return _digest_file(file, "md5")
 
-    chunk = file.read(8192)
-    while chunk:
-        md5.update(chunk)
-        chunk = file.read(8192)
 
-    return md5.hexdigest()
+def short_id(text: str) -> str:
+    """
+    生成 SBOM 元素 ID 使用的短摘要。
+
+    摘要仅用于区分元素，不涉及安全用途，因此标记 usedforsecurity=False，在 FIPS 模式的 OpenSSL 下也可使用。
+
+    Args:
+        text (str): 用于生成 ID 的文本，例如文件路径或许可证名称。
+
+    Returns:
+        str: 文本 MD5 摘要的前 12 位十六进制字符。
+    """
+
+    return hashlib.md5(text.encode("utf-8"), usedforsecurity=False).hexdigest()[:12]
 
 
 def read_data_from_json(json_file_path: str) -> Union[Dict[str, Any], List[Any]]:
@@ -70,8 +138,8 @@ def read_data_from_json(json_file_path: str) -> Union[Dict[str, Any], List[Any]]
         dict or list: 从 JSON 文件中读取的数据。可以是字典或列表。
     """
 
-    with open(json_file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(json_file_path, "rb") as f:
+        data = orjson.loads(f.read())
     return data
 
 
@@ -87,25 +155,42 @@ def save_data_to_json(data: Union[Dict[str, Any], List[Any]], json_file_path: st
         None
     """
     if data is not None:
-        with open(json_file_path, 'w', encoding='utf-8') as json_file:
-            json.dump(data, json_file, ensure_ascii=False, indent=4)
-
-
-def remove_duplicates(list_of_dicts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # orjson 直接输出 UTF-8 字节，非 ASCII 字符原样保留，整份数据一次写入
+        content = orjson.dumps(data, option=JSON_DUMP_OPTIONS)
+
+        # 先写入同目录下的唯一临时文件再原子替换，写入中断时不会留下残缺的 JSON 文件，
+        # 并发写入同一目标时也不会互相覆盖临时文件
+        try:
+            file_mode = stat.S_IMODE(os.stat(json_file_path).st_mode)
+        except FileNotFoundError:
+            file_mode = NEW_FILE_MODE
+        temp_file = tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(json_file_path) or '.', prefix=f".{os.path.basename(json_file_path)}.",
+            suffix=".tmp", delete=False)
+        try:
+            with temp_file:
+                temp_file.write(content)
+            # 临时文件默认权限为 0600，替换前恢复为目标文件原有权限
+            os.chmod(temp_file.name, file_mode)
+            os.replace(temp_file.name, json_file_path)
+        except BaseException:
+            if os.path.exists(temp_file.name):
+                os.remove(temp_file.name)
+            raise
+
+
+def remove_duplicates(list_of_dicts: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     从给定的列表中移除具有重复ID的项，并返回一个新列表，其中每个ID只出现一次。
 
     Args:
-        list_of_dicts (list of dict): 包含字典元素的列表，每个字典必须有'id'键用于唯一标识。
+        list_of_dicts (iterable of dict): 包含字典元素的列表或可迭代对象，每个字典必须有'id'键用于唯一标识。
 
     Returns:
         list of dict: 不含重复ID项的新列表。
     """
-    unique_list = []
-    seen_ids = set()
+    # 利用字典的插入顺序去重，setdefault 保证每个ID保留首次出现的项
+    unique_items = {}
     for item in list_of_dicts:
-        item_id = item.get("id")
-        if item_id not in seen_ids:
-            seen_ids.add(item_id)
-            unique_list.append(item)
-    return unique_list
+        unique_items.setdefault(item.get("id"), item)
+    return list(unique_items.values())
@@ -13,21 +13,49 @@
 # limitations under the License.
 
 from actions import ASSIST_DIR
-from actions.data_helper import read_data_from_json
-from typing import List, Dict
+from actions.data_helper import read_data_from_json, short_id
+from typing import List, Dict, Tuple
 from scancode import api as scancode
 import chardet
 import logging
 import os
 import re
-import hashlib
 import tempfile
+from functools import lru_cache
 
 
 licenses_file_path = os.path.join(ASSIST_DIR, 'licenses.json')
 SPDX_LICENSES_LIST = read_data_from_json(licenses_file_path)
 
 
+def _build_alt_name_index(licenses_list: List[Dict]) -> Dict[str, str]:
+    """
+    构建许可证别名（小写）到 SPDX 标准名称的映射。
+
+    Args:
+        licenses_list (list): 许可证辅助数据，每个元素包含 "spdx_name" 和 "alt_names" 键。
+
+    Returns:
+        dict: 以小写别名为键、SPDX 标准名称为值的字典。别名重复时保留列表中先出现的映射。
+    """
+
+    alt_name_index = {}
+    for license_info in licenses_list:
+        spdx_name = license_info.get("spdx_name")
+        if not spdx_name:
+            continue
+        for alt_name in license_info.get("alt_names", []):
+            alt_name_index.setdefault(alt_name.lower(), spdx_name)
+    return alt_name_index
+
+
+ALT_NAME_TO_SPDX = _build_alt_name_index(SPDX_LICENSES_LIST)
+LICENSE_DELIMITER_RE = re.compile(r'(\s+or\s+|\s+and\s+|[()&|])', re.IGNORECASE)
+DEP5_FILES_RE = re.compile(r'^Files:(.*)$', re.MULTILINE | re.IGNORECASE)
+DEP5_LICENSE_RE = re.compile(r'^License:(.*)$', re.MULTILINE | re.IGNORECASE)
+COMMON_LICENSE_PATH_RE = re.compile(r'/usr/share/common-licenses/[0-9A-Za-z_.+-]+[0-9A-Za-z+]')
+
+
 def deb_licenses_scanner(deb, files):
     """
     扫描 Debian 包中的许可证信息，并生成许可证信息列表。
@@ -70,7 +98,7 @@ def deb_licenses_scanner(deb, files):
         if license_list:
             for license_name in license_list:
                 license_info = {
-                    "id": f"LicenseRef-{(hashlib.md5(license_name.encode()).hexdigest())[:12]}",
+                    "id": _license_id(license_name),
                     "name": license_name,
                 }
                 licenses.append(license_info)
@@ -90,16 +118,48 @@ def rpm_licenses_scanner(license: str) -> List[Dict[str, str]]:
 
     license_info_list = []
     if license != "":
-        # 获取许可证标准名称
-        license_name = _standardize_license_name(license)
+        # 获取许可证标准名称及 ID，结果按原始许可证字符串缓存
+        license_name, license_id = _rpm_license_entry(license)
         license_info = {
-            "id": f"LicenseRef-{hashlib.md5(license_name.encode()).hexdigest()[:12]}",
+            "id": license_id,
             "name": license_name,
         }
         license_info_list.append(license_info)
     return license_info_list
 
 
+@lru_cache(maxsize=4096)
+def _rpm_license_entry(license: str) -> Tuple[str, str]:
+    """
+    计算许可证字符串对应的标准名称和 ID。同一许可证表达式在软件包和源码文件中大量重复出现，结果按原始字符串缓存。
+
+    以不可变元组缓存，调用方每次构造新的许可证字典，避免共享可变对象。
+
+    Args:
+        license (str): 许可证名称或表达式。
+
+    Returns:
+        tuple: 标准化后的许可证名称和许可证 ID。
+    """
+
+    license_name = _standardize_license_name(license)
+    return license_name, _license_id(license_name)
+
+
+def _license_id(license_name: str) -> str:
+    """
+    生成许可证的 SBOM ID。
+
+    Args:
+        license_name (str): 许可证名称。
+
+    Returns:
+        str: 形如 "LicenseRef-<md5前12位>" 的许可证 ID。
+    """
+
+    return f"LicenseRef-{short_id(license_name)}"
+
+
 def _decode_content(file_content):
     """
     解码文件内容，并处理可能出现的编码问题。
@@ -148,19 +208,15 @@ def _machine_readable_format_scanner(content):
     licenses_set = set()
     files_matched = False
 
-    # 定义正则表达式用于匹配文件和许可证信息
-    files_regex = re.compile(r'^Files:(.*)$', re.MULTILINE | re.IGNORECASE)
-    license_regex = re.compile(r'^License:(.*)$', re.MULTILINE | re.IGNORECASE)
-
     for line in content.splitlines():
         # 匹配并记录当前文件
-        files_match = files_regex.match(line)
+        files_match = DEP5_FILES_RE.match(line)
         if files_match:
             files_matched = True
             continue
 
         # 匹配并记录与当前文件对应的许可证信息，确保信息不重复
-        license_match = license_regex.match(line)
+        license_match = DEP5_LICENSE_RE.match(line)
         if license_match and files_matched:
             raw_license_info = license_match.group(1).strip()
             # 数据清洗：去除特定值、前后空格、句号和逗号
@@ -191,12 +247,8 @@ def _common_licenses_scanner(content):
               列表按文件名自然顺序排列。
     """
 
-    # 定义正则表达式，匹配许可证文件路径
-    license_regex = re.compile(
-        r'/usr/share/common-licenses/[0-9A-Za-z_.+-]+[0-9A-Za-z+]')
-
-    # 找到所有匹配项并提取文件名
-    matches = license_regex.findall(content)
+    # 找到所有匹配许可证文件路径的项并提取文件名
+    matches = COMMON_LICENSE_PATH_RE.findall(content)
 
     # 提取许可证部分（从第5个斜杠开始到字符串末尾），并去除前后空格及末尾句号
     licenses = [
@@ -204,7 +256,7 @@ def _common_licenses_scanner(content):
     ]
 
     # 去重并保持有序
-    license_list = list(set(licenses))
+    license_list = list(dict.fromkeys(licenses))
 
     return license_list
     
@@ -243,31 +295,14 @@ def _standardize_license_name(license_input: str) -> str:
         str: 标准化的 SPDX 许可名称。如果未找到匹配项，则返回原始输入。
     """
 
-    # 定义分隔符的正则表达式模式
-    delimiter_pattern = r'(?i)(\s+or\s+|\s+and\s+|[()&|])'
-
-    # 使用正则表达式按分隔符进行分割
-    segments = re.split(delimiter_pattern, license_input)
-
-    # 创建一个用于存放 (alt_name, spdxName) 对的列表
-    replacement_pairs = []
-    for license_info in SPDX_LICENSES_LIST:
-        spdx_name = license_info.get("spdx_name")
-        if not spdx_name:
-            continue
-        for alt_name in license_info.get("alt_names", []):
-            replacement_pairs.append((alt_name, spdx_name))
-
-    # 按 alt_name 的长度从长到短排序，确保长的先替换
-    replacement_pairs.sort(key=lambda x: len(x[0]), reverse=True)
+    # 使用预编译的正则表达式按分隔符进行分割
+    segments = LICENSE_DELIMITER_RE.split(license_input)
 
-    # 遍历每个片段，检查是否匹配任何许可证名
+    # 逐个片段在别名索引中查找（忽略大小写），命中则替换为 SPDX 标准名称
     for i, segment in enumerate(segments):
-        for alt_name, spdx_name in replacement_pairs:
-            # 忽略大小写的匹配
-            if segment.strip().lower() == alt_name.lower():
-                segments[i] = spdx_name
-                break
+        spdx_name = ALT_NAME_TO_SPDX.get(segment.strip().lower())
+        if spdx_name:
+            segments[i] = spdx_name
 
     # 将片段重新组合为最终字符串，确保空格被保留
     return ''.join(segments)
@@ -156,14 +156,15 @@ class Package:
             list: Linx file_relationships 列表。
         """
 
-        relationships = []
-        for file in self.files:
-            relationships.append({
-                "id": self.id,
+        package_id = self.id
+        return [
+            {
+                "id": package_id,
                 "related_element": file['id'],
                 "relationship_type": "CONTAINS"
-            })
-        return relationships
+            }
+            for file in self.files
+        ]
 
     def get_json(self) -> dict:
         """转换为 Linx package JSON 对象。
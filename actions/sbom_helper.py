@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from actions import ASSIST_DIR
@@ -55,7 +56,7 @@ def build_sbom_header(
             "os_version": os_version or "NOASSERTION",
             "os_arch": os_arch or "NOASSERTION",
             "creation_info": {
-                "creators": read_data_from_json(CREATORS_FILE_PATH),
+                "creators": list(load_creators()),
                 "created": created_time,
             },
             data_name: sbom_data,
@@ -67,7 +68,7 @@ def build_sbom_header(
     header = {
         "scan_target": scan_target or "NOASSERTION",
         "creation_info": {
-            "creators": read_data_from_json(CREATORS_FILE_PATH),
+            "creators": list(load_creators()),
             "created": created_time,
         },
         data_name: sbom_data,
@@ -75,3 +76,14 @@ def build_sbom_header(
     if extra_metadata:
         header.update(extra_metadata)
     return header
+
+
+@lru_cache(maxsize=1)
+def load_creators() -> tuple:
+    """读取 creators.json，每个进程只解析一次。
+
+    Returns:
+        tuple: 创建者信息。以元组缓存，调用方需要列表时各自拷贝，避免共享可变对象。
+    """
+
+    return tuple(read_data_from_json(CREATORS_FILE_PATH))
@@ -25,10 +25,11 @@ import subprocess
 import tarfile
 import tempfile
 
+import orjson
 import requests
 
 from actions import ASSIST_DIR
-from actions.data_helper import read_data_from_json, remove_duplicates
+from actions.data_helper import read_data_from_json, remove_duplicates, short_id
 from actions.licenses_helper import _extract_deb_license_list, rpm_licenses_scanner
 from actions.package import Package
 from actions.sbom_helper import build_sbom_header
@@ -477,7 +478,7 @@ def _read_json_member(archive: tarfile.TarFile, member_name: str) -> Dict[str, A
     if member_file is None:
         raise ValueError(f"离线 Docker 镜像文件无法读取: {member_name}")
     with member_file:
-        return json.loads(member_file.read().decode("utf-8"))
+        return orjson.loads(member_file.read())
 
 
 def _apply_archive_layer(
@@ -904,7 +905,7 @@ def _build_file_info(path: str, algorithm: str, checksum: str) -> Dict[str, Any]
     """构建 Linx 文件元素。"""
 
     basename = os.path.basename(path)
-    id_md5 = hashlib.md5(path.encode("utf-8")).hexdigest()[:12]
+    id_md5 = short_id(path)
     return {
         "id": f"File-{basename}-{id_md5}",
         "name": basename,
@@ -920,7 +921,7 @@ def _build_license_info(license_name: str) -> Dict[str, str]:
     """构建 Linx 许可证元素。"""
 
     return {
-        "id": f"LicenseRef-{hashlib.md5(license_name.encode()).hexdigest()[:12]}",
+        "id": f"LicenseRef-{short_id(license_name)}",
         "name": license_name,
     }
 
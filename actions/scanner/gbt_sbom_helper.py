@@ -13,22 +13,23 @@
 # limitations under the License.
 
 import hashlib
-import json
 import logging
 import os
 import re
 import subprocess
 import tempfile
 import uuid
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 import requests
 
 from actions import ASSIST_DIR
 from actions.data_helper import read_data_from_json
+from actions.sbom_helper import load_creators
 
 
-CREATORS_FILE_PATH = os.path.join(ASSIST_DIR, "creators.json")
 LICENSES_FILE_PATH = os.path.join(ASSIST_DIR, "licenses.json")
 LICENSE_INDEX_FILE_PATH = os.path.join(ASSIST_DIR, "index.json")
 REQUEST_TIMEOUT = 30
@@ -164,7 +165,7 @@ def convert_to_gbt(
         software_package, component_packages, software, components)
     vulnerabilities = query_gbt_vulnerabilities(
         vulnerability_subjects, ecosystem, config)
-    creators = parse_creators(read_data_from_json(CREATORS_FILE_PATH))
+    creators = parse_creators(load_creators())
 
     return {
         "software": software,
@@ -829,18 +830,7 @@ def _extract_fixed_version(affected: Dict[str, Any]) -> str:
 
 
 def _find_license_rule(license_name: str) -> Optional[Dict[str, Any]]:
-    try:
-        licenses = read_data_from_json(LICENSES_FILE_PATH)
-    except Exception:
-        return None
-
-    normalized = license_name.lower()
-    for license_rule in licenses:
-        names = [license_rule.get("spdx_name", "")]
-        names.extend(license_rule.get("alt_names", []))
-        if any(normalized == str(name).lower() for name in names):
-            return license_rule
-    return None
+    return _load_license_rules().get(license_name.lower())
 
 
 def _get_license_risk_description(license_name: str) -> str:
@@ -852,21 +842,54 @@ def _get_license_risk_description(license_name: str) -> str:
 
 
 def _get_license_category(license_name: str) -> str:
+    return _load_license_categories().get(license_name.lower(), "Unknown")
+
+
+@lru_cache(maxsize=None)
+def _load_license_rules() -> Dict[str, Dict[str, Any]]:
+    """读取 licenses.json 并建立小写名称到许可证规则的索引，每个进程只解析一次。
+
+    Returns:
+        dict: 键为 SPDX 名称及别名的小写形式；同名时保留文件中先出现的规则。读取失败时返回空字典。
+    """
+
+    try:
+        licenses = read_data_from_json(LICENSES_FILE_PATH)
+    except Exception:
+        return {}
+
+    rules = {}
+    for license_rule in licenses:
+        names = [license_rule.get("spdx_name", "")]
+        names.extend(license_rule.get("alt_names", []))
+        for name in names:
+            rules.setdefault(str(name).lower(), license_rule)
+    return rules
+
+
+@lru_cache(maxsize=None)
+def _load_license_categories() -> Dict[str, str]:
+    """读取 index.json 并建立小写许可证键到分类的索引，每个进程只解析一次。
+
+    Returns:
+        dict: 键为 license_key 及各 SPDX 键的小写形式；同名时保留文件中先出现的分类。读取失败时返回空字典。
+    """
+
     try:
         index = read_data_from_json(LICENSE_INDEX_FILE_PATH)
     except Exception:
-        return "Unknown"
+        return {}
 
-    normalized = license_name.lower()
+    categories = {}
     for item in index:
         keys = [
             item.get("license_key", ""),
             item.get("spdx_license_key", ""),
         ]
         keys.extend(item.get("other_spdx_license_keys", []))
-        if any(normalized == str(key).lower() for key in keys):
-            return item.get("category", "Unknown")
-    return "Unknown"
+        for key in keys:
+            categories.setdefault(str(key).lower(), item.get("category", "Unknown"))
+    return categories
 
 
 def _map_relationship_type(relationship_type: str) -> str:
@@ -932,4 +955,5 @@ def _run_openssl(command: List[str]) -> None:
 
 
 def _json_dumps(value: Dict[str, Any]) -> str:
-    return json.dumps(value, ensure_ascii=False)
+    # orjson 输出紧凑的 UTF-8 JSON，非 ASCII 字符原样保留
+    return orjson.dumps(value).decode("utf-8")
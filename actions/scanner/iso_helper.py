@@ -27,15 +27,16 @@ from actions.scanner.package_helper import (
     process_rpm_package,
     process_deb_package
 )
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from collections import Counter
+from functools import partial
+from itertools import chain
 import logging
 import os
 import re
 import tempfile
-import threading
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import pycdlib
 from tqdm import tqdm
 
@@ -69,6 +70,19 @@ ARCH_ALIASES = {
     "noarch": "noarch",
     "all": "all",
 }
+ISO_TASK_CHUNKSIZE = 16
+EFI_BOOT_ARCHES = {
+    "bootx64.efi": "x86_64",
+    "bootaa64.efi": "aarch64",
+    "bootloongarch64.efi": "loongarch64",
+}
+DEB_REPO_ARCH_RE = re.compile(r"(?:^|/)binary-([A-Za-z0-9_+-]+)(?:/|$)")
+DEB_FILENAME_ARCH_RE = re.compile(r"_([A-Za-z0-9][A-Za-z0-9_+-]*)\.deb$", re.IGNORECASE)
+ISO_VERSION_SUFFIX_RE = re.compile(r";\d+$")
+RPM_FILENAME_ARCH_RE = re.compile(r"\.([A-Za-z0-9_]+)\.rpm$", re.IGNORECASE)
+
+# ISO 扫描工作进程内的状态，由 _init_iso_worker 在每个进程启动时填充
+_WORKER_STATE: Dict[str, Any] = {}
 
 
 @dataclass(frozen=True)
@@ -113,18 +127,19 @@ def scan_iso(
     reader = PyCdlibIsoReader(iso_path)
     try:
         entries = reader.list_entries()
-        deb_entries = _find_package_entries(entries, ".deb")
-        rpm_entries = _find_package_entries(entries, ".rpm")
+        package_entries = _group_package_entries(entries, (".deb", ".rpm"))
+        deb_entries = package_entries[".deb"]
+        rpm_entries = package_entries[".rpm"]
 
         if deb_entries:
             logging.info("侦测到DEB包系统")
             return _scan_deb_entries(
-                reader, deb_entries, entries, iso_filename, created_time,
+                iso_path, deb_entries, entries, iso_filename, created_time,
                 disable_tqdm, workers), "deb"
         if rpm_entries:
             logging.info("侦测到RPM包系统")
             return _scan_rpm_entries(
-                reader, rpm_entries, entries, iso_filename, created_time,
+                iso_path, rpm_entries, entries, iso_filename, created_time,
                 disable_tqdm, workers), "rpm"
 
         raise ValueError("未侦测到有效的包系统")
@@ -133,7 +148,7 @@ def scan_iso(
 
 
 def _scan_deb_entries(
-    reader: Any,
+    iso_path: str,
     package_entries: List[IsoEntry],
     all_entries: List[IsoEntry],
     iso_filename: str,
@@ -142,53 +157,21 @@ def _scan_deb_entries(
     workers: Optional[int],
 ) -> Dict[str, Any]:
     packages = []
-    files = []
-    file_relationships = []
-    licenses = []
+    license_lists = []
 
     originators_file_path = os.path.join(ASSIST_DIR, 'originators.json')
     originators = read_data_from_json(originators_file_path)
 
-    if workers is None:
-        logging.info("使用默认的线程数进行扫描")
-    else:
-        logging.info(f"使用 {workers} 个线程进行扫描")
-
-    reader_lock = threading.Lock()
-    with tempfile.TemporaryDirectory(prefix="linx_iso_") as temp_dir:
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {
-                executor.submit(
-                    _process_iso_package_entry,
-                    reader, entry, temp_dir, originators, reader_lock,
-                    process_deb_package
-                ): entry
-                for entry in package_entries
-            }
-
-            progress_iter = (
-                tqdm(total=len(futures), desc="扫描 DEB 包",
-                     unit="包") if not disable_tqdm else None
-            )
-
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    package, package_licenses, updated_originators = result
-                    if package:
-                        packages.append(package)
-                        files.extend(package.files)
-                        file_relationships.extend(package.get_file_relationships())
-                        licenses.extend(package_licenses)
-                        originators = updated_originators
-                if not disable_tqdm:
-                    progress_iter.update(1)
-
-            if not disable_tqdm:
-                progress_iter.close()
+    for package, package_licenses, _ in _scan_iso_packages(
+            iso_path, package_entries, "deb", originators, disable_tqdm, workers):
+        packages.append(package)
+        license_lists.append(package_licenses)
 
-    files = remove_duplicates(files)
-    licenses = remove_duplicates(licenses)
+    # 扫描结束后一次性拼接各包的结果，再交给去重，避免逐包 extend 中间列表
+    files = remove_duplicates(chain.from_iterable(package.files for package in packages))
+    file_relationships = list(chain.from_iterable(
+        package.get_file_relationships() for package in packages))
+    licenses = remove_duplicates(chain.from_iterable(license_lists))
 
     packages_sbom = [package.get_json() for package in packages]
     packages_sbom.sort(key=lambda x: x.get("name", ""))
@@ -205,7 +188,7 @@ def _scan_deb_entries(
 
 
 def _scan_rpm_entries(
-    reader: Any,
+    iso_path: str,
     package_entries: List[IsoEntry],
     all_entries: List[IsoEntry],
     iso_filename: str,
@@ -214,56 +197,24 @@ def _scan_rpm_entries(
     workers: Optional[int],
 ) -> Dict[str, Any]:
     packages = []
-    files = []
-    file_relationships = []
-    licenses = []
+    license_lists = []
     provides_relationships = []
 
     originators_file_path = os.path.join(ASSIST_DIR, 'originators.json')
     originators = read_data_from_json(originators_file_path)
 
-    if workers is None:
-        logging.info("使用默认的线程数进行扫描")
-    else:
-        logging.info(f"使用 {workers} 个线程进行扫描")
-
-    reader_lock = threading.Lock()
-    with tempfile.TemporaryDirectory(prefix="linx_iso_") as temp_dir:
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {
-                executor.submit(
-                    _process_iso_package_entry,
-                    reader, entry, temp_dir, originators, reader_lock,
-                    process_rpm_package
-                ): entry
-                for entry in package_entries
-            }
-
-            progress_iter = (
-                tqdm(total=len(futures), desc="扫描 RPM 包",
-                     unit="包") if not disable_tqdm else None
-            )
-
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    package, package_licenses, updated_originators, provides = result
-                    if package:
-                        packages.append(package)
-                        files.extend(package.files)
-                        file_relationships.extend(package.get_file_relationships())
-                        licenses.extend(package_licenses)
-                        originators = updated_originators
-                        if provides:
-                            provides_relationships.append(provides)
-                if not disable_tqdm:
-                    progress_iter.update(1)
+    for package, package_licenses, provides in _scan_iso_packages(
+            iso_path, package_entries, "rpm", originators, disable_tqdm, workers):
+        packages.append(package)
+        license_lists.append(package_licenses)
+        if provides:
+            provides_relationships.append(provides)
 
-            if not disable_tqdm:
-                progress_iter.close()
-
-    files = remove_duplicates(files)
-    licenses = remove_duplicates(licenses)
+    # 扫描结束后一次性拼接各包的结果，再交给去重，避免逐包 extend 中间列表
+    files = remove_duplicates(chain.from_iterable(package.files for package in packages))
+    file_relationships = list(chain.from_iterable(
+        package.get_file_relationships() for package in packages))
+    licenses = remove_duplicates(chain.from_iterable(license_lists))
 
     packages_sbom = [package.get_json() for package in packages]
     packages_sbom.sort(key=lambda x: x.get("name", ""))
@@ -280,20 +231,118 @@ def _scan_rpm_entries(
     return linx_sbom
 
 
+def _scan_iso_packages(
+    iso_path: str,
+    package_entries: List[IsoEntry],
+    package_type: str,
+    originators: List[Dict[str, Any]],
+    disable_tqdm: bool,
+    workers: Optional[int],
+) -> Iterator[Tuple[Any, List[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    """在进程池中并行解析 ISO 内的软件包。
+
+    每个工作进程在初始化时独立打开 ISO 并持有一份发起者数据快照，任务只传递
+    ISO 条目；工作进程仅回传本次新增的发起者条目，由父进程按主页去重合并。
+
+    Args:
+        iso_path (str): ISO 文件路径。
+        package_entries (list): 待扫描的软件包条目。
+        package_type (str): 软件包类型，"rpm" 或 "deb"。
+        originators (list): 发起者辅助数据，新增条目会合并到该列表中。
+        disable_tqdm (bool): 是否禁用进度条。
+        workers (int | None): 最大进程数，None 表示使用默认值。
+
+    Yields:
+        tuple: 包对象、许可证列表和 provides 信息（DEB 包为 None）。
+    """
+
+    if workers is None:
+        logging.info("使用默认的进程数进行扫描")
+    else:
+        logging.info(f"使用 {workers} 个进程进行扫描")
+
+    known_homepages = {originator.get("homepage") for originator in originators}
+    progress_iter = (
+        tqdm(total=len(package_entries), desc=f"扫描 {package_type.upper()} 包",
+             unit="包") if not disable_tqdm else None
+    )
+
+    with tempfile.TemporaryDirectory(prefix="linx_iso_") as temp_dir:
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_iso_worker,
+                initargs=(iso_path, temp_dir, originators)) as executor:
+            # 批量分发任务，减少进程间通信次数；小规模扫描时缩小批次以保持各进程负载均衡
+            max_workers = workers or os.cpu_count() or 1
+            chunksize = max(1, min(ISO_TASK_CHUNKSIZE, len(package_entries) // (max_workers * 4)))
+            results = executor.map(
+                partial(_process_iso_worker_entry, package_type=package_type),
+                package_entries, chunksize=chunksize)
+
+            for result, new_originators in results:
+                for originator in new_originators:
+                    if originator.get("homepage") not in known_homepages:
+                        known_homepages.add(originator.get("homepage"))
+                        originators.append(originator)
+                if result and result[0]:
+                    yield result
+                if not disable_tqdm:
+                    progress_iter.update(1)
+
+    if not disable_tqdm:
+        progress_iter.close()
+
+
+def _init_iso_worker(iso_path: str, temp_dir: str, originators: List[Dict[str, Any]]) -> None:
+    """初始化 ISO 扫描工作进程：打开 ISO 并保存临时目录与发起者数据快照。"""
+
+    _WORKER_STATE["reader"] = PyCdlibIsoReader(iso_path)
+    _WORKER_STATE["temp_dir"] = temp_dir
+    _WORKER_STATE["originators"] = list(originators)
+
+
+def _process_iso_worker_entry(
+    entry: IsoEntry,
+    package_type: str,
+) -> Tuple[Optional[Tuple[Any, List[Dict[str, Any]], Optional[Dict[str, Any]]]], List[Dict[str, Any]]]:
+    """在工作进程中解析单个 ISO 软件包条目。
+
+    Args:
+        entry (IsoEntry): ISO 内的软件包条目。
+        package_type (str): 软件包类型，"rpm" 或 "deb"。
+
+    Returns:
+        tuple: (包对象、许可证列表、provides 信息) 或 None，以及本次新增的发起者条目。
+    """
+
+    originators = _WORKER_STATE["originators"]
+    known_count = len(originators)
+    package_processor = process_rpm_package if package_type == "rpm" else process_deb_package
+
+    result = _process_iso_package_entry(
+        _WORKER_STATE["reader"], entry, _WORKER_STATE["temp_dir"], originators,
+        package_processor)
+    new_originators = originators[known_count:]
+
+    if not result:
+        return None, new_originators
+    package, licenses = result[0], result[1]
+    provides = result[3] if len(result) > 3 else None
+    return (package, licenses, provides), new_originators
+
+
 def _process_iso_package_entry(
     reader: Any,
     entry: IsoEntry,
     temp_dir: str,
     originators: List[Dict[str, Any]],
-    reader_lock: threading.Lock,
     package_processor: Callable[..., Tuple[Any, ...]],
 ) -> Optional[Tuple[Any, ...]]:
     suffix = _entry_suffix(entry)
     fd, package_path = tempfile.mkstemp(suffix=suffix, dir=temp_dir)
     os.close(fd)
     try:
-        with reader_lock:
-            reader.extract_file(entry, package_path)
+        reader.extract_file(entry, package_path)
         return package_processor(package_path, originators)
     except Exception as exc:
         logging.error(f"跳过 ISO 内软件包 {entry.display_path} 由于读取错误: {exc}")
@@ -324,11 +373,20 @@ def _path_keyword(path_type: str) -> str:
     return ISO_PATH_TYPE_CONFIG[path_type][1]
 
 
-def _find_package_entries(entries: Iterable[IsoEntry], suffix: str) -> List[IsoEntry]:
-    return [
-        entry for entry in entries
-        if _strip_iso_version(entry.display_path).lower().endswith(suffix)
-    ]
+def _group_package_entries(
+    entries: Iterable[IsoEntry],
+    suffixes: Tuple[str, ...],
+) -> Dict[str, List[IsoEntry]]:
+    """单次遍历 ISO 条目，按软件包后缀分组，每个路径只规范化一次。"""
+
+    groups = {suffix: [] for suffix in suffixes}
+    for entry in entries:
+        path = _strip_iso_version(entry.display_path).lower()
+        for suffix in suffixes:
+            if path.endswith(suffix):
+                groups[suffix].append(entry)
+                break
+    return groups
 
 
 def detect_iso_arch(
@@ -336,9 +394,10 @@ def detect_iso_arch(
     packages_sbom: Optional[List[Dict[str, Any]]] = None,
     iso_filename: str = "",
 ) -> Optional[str]:
-    paths = [_entry_display_path(entry) for entry in entries]
+    repo_counter, filename_counter, boot_arch = _collect_path_arch_signals(
+        _entry_display_path(entry) for entry in entries)
 
-    repo_arch = _detect_arch_from_debian_repo_paths(paths)
+    repo_arch = _most_common_machine_arch(repo_counter)
     if repo_arch:
         return repo_arch
 
@@ -346,11 +405,10 @@ def detect_iso_arch(
     if package_arch:
         return package_arch
 
-    filename_arch = _detect_arch_from_package_filenames(paths)
+    filename_arch = _most_common_machine_arch(filename_counter)
     if filename_arch:
         return filename_arch
 
-    boot_arch = _detect_arch_from_boot_paths(paths)
     if boot_arch:
         return boot_arch
 
@@ -362,54 +420,51 @@ def detect_iso_arch(
     return None
 
 
-def _detect_arch_from_debian_repo_paths(paths: List[str]) -> Optional[str]:
-    counter = Counter()
-    for path in paths:
-        match = re.search(r"(?:^|/)binary-([A-Za-z0-9_+-]+)(?:/|$)", path)
-        if match:
-            counter[_normalize_arch(match.group(1))] += 1
-    return _most_common_machine_arch(counter)
+def _collect_path_arch_signals(paths: Iterable[str]) -> Tuple[Counter, Counter, Optional[str]]:
+    """单次遍历 ISO 路径，同时收集各类架构线索。
 
+    Args:
+        paths (Iterable[str]): ISO 内文件的展示路径。
 
-def _detect_arch_from_packages(packages_sbom: List[Dict[str, Any]]) -> Optional[str]:
-    counter = Counter()
-    for package in packages_sbom:
-        arch = _normalize_arch(package.get("architecture"))
-        if arch:
-            counter[arch] += 1
-    return _most_common_machine_arch(counter)
+    Returns:
+        tuple: Debian 仓库目录架构计数、软件包文件名架构计数，以及引导文件推断出的架构。
+    """
 
+    repo_counter = Counter()
+    filename_counter = Counter()
+    efi_arch = None
+    has_powerpc_grub = False
 
-def _detect_arch_from_package_filenames(paths: List[str]) -> Optional[str]:
-    counter = Counter()
     for path in paths:
+        repo_match = DEB_REPO_ARCH_RE.search(path)
+        if repo_match:
+            repo_counter[_normalize_arch(repo_match.group(1))] += 1
+
         clean_path = _strip_iso_version(path)
-        deb_match = re.search(r"_([A-Za-z0-9][A-Za-z0-9_+-]*)\.deb$", clean_path, re.IGNORECASE)
+        deb_match = DEB_FILENAME_ARCH_RE.search(clean_path)
         if deb_match:
-            counter[_normalize_arch(deb_match.group(1))] += 1
-            continue
+            filename_counter[_normalize_arch(deb_match.group(1))] += 1
+        else:
+            rpm_match = RPM_FILENAME_ARCH_RE.search(clean_path)
+            if rpm_match:
+                filename_counter[_normalize_arch(rpm_match.group(1))] += 1
 
-        rpm_match = re.search(r"\.([A-Za-z0-9_]+)\.rpm$", clean_path, re.IGNORECASE)
-        if rpm_match:
-            counter[_normalize_arch(rpm_match.group(1))] += 1
-    return _most_common_machine_arch(counter)
+        if efi_arch is None:
+            efi_arch = EFI_BOOT_ARCHES.get(path.rsplit("/", 1)[-1].lower())
+        if not has_powerpc_grub and "boot/grub/powerpc" in path.lower():
+            has_powerpc_grub = True
 
+    boot_arch = efi_arch or ("ppc64el" if has_powerpc_grub else None)
+    return repo_counter, filename_counter, boot_arch
 
-def _detect_arch_from_boot_paths(paths: List[str]) -> Optional[str]:
-    upper_paths = [path.upper() for path in paths]
-    for path in upper_paths:
-        basename = path.rsplit("/", 1)[-1]
-        if basename == "BOOTX64.EFI":
-            return "x86_64"
-        if basename == "BOOTAA64.EFI":
-            return "aarch64"
-        if basename == "BOOTLOONGARCH64.EFI":
-            return "loongarch64"
-    for path in paths:
-        lower_path = path.lower()
-        if "boot/grub/powerpc" in lower_path:
-            return "ppc64el"
-    return None
+
+def _detect_arch_from_packages(packages_sbom: List[Dict[str, Any]]) -> Optional[str]:
+    counter = Counter()
+    for package in packages_sbom:
+        arch = _normalize_arch(package.get("architecture"))
+        if arch:
+            counter[arch] += 1
+    return _most_common_machine_arch(counter)
 
 
 def _detect_arch_from_iso_filename(iso_filename: str) -> Optional[str]:
@@ -460,7 +515,7 @@ def _normalize_display_path(path: str) -> str:
 
 
 def _strip_iso_version(path: str) -> str:
-    return re.sub(r";\d+$", "", path)
+    return ISO_VERSION_SUFFIX_RE.sub("", path)
 
 
 def _build_iso_sbom(
@@ -14,6 +14,11 @@
 
 from typing import List, Dict, Optional, Tuple, Any
 
+# 最近一次使用的发起者列表及其主页索引。扫描过程中始终复用同一个列表，
+# 因此只需在列表新增条目时增量更新索引，即可把每次查找从线性扫描降为字典查找。
+_ORIGINATORS_INDEX: Dict[str, Any] = {"originators": None, "count": 0, "index": {}}
+
+
 def extract_originator_name(
     homepage: str, 
     originators: List[Dict[str, Any]]
@@ -36,8 +41,7 @@ def extract_originator_name(
         return homepage, False, originators
 
     # 尝试从originators中找到与homepage匹配的项
-    matched_originator = next((originator for originator in originators
-                               if originator.get('homepage') == homepage), None)
+    matched_originator = _get_originators_index(originators).get(homepage)
 
     if matched_originator:
         # 如果找到匹配项，返回其名称、是否为组织及原originators列表
@@ -55,3 +59,25 @@ def extract_originator_name(
         originators.append(new_originator)
 
         return None, False, originators
+
+
+def _get_originators_index(originators: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    获取发起者列表的主页索引，列表发生变化时增量更新。
+
+    Args:
+        originators (list): 发起者信息列表。
+
+    Returns:
+        dict: 以主页为键、发起者条目为值的字典。主页重复时保留列表中先出现的条目。
+    """
+
+    state = _ORIGINATORS_INDEX
+    if state["originators"] is not originators or state["count"] > len(originators):
+        state.update(originators=originators, count=0, index={})
+
+    index = state["index"]
+    for originator in originators[state["count"]:]:
+        index.setdefault(originator.get('homepage'), originator)
+    state["count"] = len(originators)
+    return index
@@ -12,67 +12,63 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import hashlib
 import os
-import rpmfile
 import debian.debfile
 from typing import List, Dict, Any
 
-from actions.data_helper import calculate_md5
+from actions.data_helper import calculate_md5, short_id
 
 
-def rpm_files_scanner(package_path: str) -> List[Dict[str, Any]]:
+def rpm_files_scanner(header: Dict[Any, Any]) -> List[Dict[str, Any]]:
     """
-    扫描RPM包中的文件信息并构建文件列表。
+    根据RPM包头部信息构建文件列表。
 
     Args:
-        package_path (str): RPM包的路径。
+        header (dict): 已打开RPM包的头部信息（`rpmfile.RPMFile.headers`），由调用方复用，避免重复解析RPM文件。
 
     Returns:
         list: 包含文件信息的列表，每个元素是一个字典，包含文件ID、名称、路径和校验信息。
     """
 
-    # 打开RPM文件并读取头部信息
-    with rpmfile.open(package_path) as rpm:
-        header = rpm.headers
-
-        # 使用get()方法检查必要的键是否存在，并且不为空
-        dirnames = header.get('dirnames', [])
-        basenames = header.get('basenames', [])
-        dirindexes = header.get('dirindexes', [])
-        filemd5s = header.get('filemd5s', [])
-
-        # 将单个元素转换为列表
-        if isinstance(dirnames, (bytes, str)):
-            dirnames = [dirnames]
-        if isinstance(basenames, (bytes, str)):
-            basenames = [basenames]
-        if isinstance(dirindexes, int):
-            dirindexes = [dirindexes]
-        if isinstance(filemd5s, (bytes, str)):
-            filemd5s = [filemd5s]
-
-        # 构建文件路径和校验信息
-        file_list = []
-        for i in range(len(basenames)):
-            # filemd5s[i]为空代表非文件，跳过
-            if not filemd5s[i]:
-                continue
-            file_path = dirnames[dirindexes[i]].decode(
-                'utf-8') + basenames[i].decode('utf-8')
-            id_md5 = hashlib.md5(file_path.encode()).hexdigest()[:12]
-            file_info = {
-                "id": f"File-{basenames[i].decode('utf-8')}-{id_md5}",
-                "name": basenames[i].decode('utf-8'),
-                "path": file_path,
-                "checksums": {
-                    "algorithm": "MD5",
-                    "value": filemd5s[i].decode('utf-8')
-                }
+    # 使用get()方法检查必要的键是否存在，并且不为空
+    dirnames = header.get('dirnames', [])
+    basenames = header.get('basenames', [])
+    dirindexes = header.get('dirindexes', [])
+    filemd5s = header.get('filemd5s', [])
+
+    # 将单个元素转换为列表
+    if isinstance(dirnames, (bytes, str)):
+        dirnames = [dirnames]
+    if isinstance(basenames, (bytes, str)):
+        basenames = [basenames]
+    if isinstance(dirindexes, int):
+        dirindexes = [dirindexes]
+    if isinstance(filemd5s, (bytes, str)):
+        filemd5s = [filemd5s]
+
+    # 目录名只解码一次，避免每个文件重复解码
+    decoded_dirnames = [dirname.decode('utf-8') for dirname in dirnames]
+
+    # 构建文件路径和校验信息
+    file_list = []
+    for basename, dirindex, filemd5 in zip(basenames, dirindexes, filemd5s):
+        # filemd5 为空代表非文件，跳过
+        if not filemd5:
+            continue
+        file_name = basename.decode('utf-8')
+        file_path = decoded_dirnames[dirindex] + file_name
+        id_md5 = short_id(file_path)
+        file_list.append({
+            "id": f"File-{file_name}-{id_md5}",
+            "name": file_name,
+            "path": file_path,
+            "checksums": {
+                "algorithm": "MD5",
+                "value": filemd5.decode('utf-8')
             }
-            file_list.append(file_info)
+        })
 
-        return file_list
+    return file_list
 
 
 def deb_files_scanner(deb: debian.debfile.DebFile) -> List[Dict[str, Any]]:
@@ -100,12 +96,12 @@ def deb_files_scanner(deb: debian.debfile.DebFile) -> List[Dict[str, Any]]:
             with extracted_file:
                 file_md5 = calculate_md5(extracted_file)
 
-            # 创建一个MD5哈希对象
-            id_md5 = hashlib.md5(file_path.encode()).hexdigest()
+            # 根据文件路径生成短 ID
+            id_md5 = short_id(file_path)
 
             # 构建文件信息字典
             file_info = {
-                "id": f"File-{os.path.basename(file_path)}-{id_md5[:12]}",
+                "id": f"File-{os.path.basename(file_path)}-{id_md5}",
                 "name": os.path.basename(file_path),
                 "path": file_path,
                 "checksums": {
@@ -197,58 +197,56 @@ def _build_deb_package(deb, control_info, package_sha1, originators):
 
 def process_rpm_package(pkg_path, originators):
 
-    with open(pkg_path, 'rb') as f:
-        package_sha1 = calculate_sha1(f)
     try:
-        with rpmfile.open(pkg_path) as rpm:
-            name = _safe_decode(rpm.headers.get('name'))
-            version = _safe_decode(rpm.headers.get('version'))
-            release = _safe_decode(rpm.headers.get('release'))
-            homepage = _safe_decode(rpm.headers.get('url'))
-            architecture = _safe_decode(rpm.headers.get('arch'))
-            src_rpm = _safe_decode(rpm.headers.get('sourcerpm'))
-
-            # 提取发起者名称、判断是否为组织及更新发起者列表
-            originator_name, is_organization, originators = extract_originator_name(
-                homepage, originators)
-
-            suppliers = get_suppliers(
-                release, homepage, originator_name, RPM_SUPPLIERS)
-
-            # 创建Package对象
-            package = Package(name, version, release,
-                              architecture, "rpm", "SHA1", package_sha1)
-
-            # 设置源码包名
-            package.set_source(src_rpm)
-
-            # 获取许可证信息
-            licenses = rpm_licenses_scanner(
-                _safe_decode(rpm.headers.get('copyright')))
-            for license_info in licenses:
-                package.add_license(license_info.get("id"))
-
-            # 设置供应商信息
-            for supplier in suppliers:
-                package.add_supplier(supplier)
-
-            # 设置描述信息
-            package.set_description(_safe_decode(
-                rpm.headers.get('description')))
-
-            # 获取依赖信息
-            for dep in rpm.headers.get('requirename'):
-                package.add_declared_dep(_safe_decode(dep))
-
-            # 获取文件信息
-            files = rpm_files_scanner(pkg_path)
-            for file_info in files:
-                package.add_file(file_info)
-
-            provides = {
-                "id": package.id,
-                "provides": list(set(_safe_decode(provide) for provide in rpm.headers.get('provides'))),
-            }
+        with open(pkg_path, 'rb') as f:
+            # 同一文件句柄先计算 SHA1，再回到文件头交给 rpmfile 解析，避免重复打开和读取
+            package_sha1 = calculate_sha1(f)
+            f.seek(0)
+            with rpmfile.open(fileobj=f) as rpm:
+                (name, version, release, homepage, architecture, src_rpm,
+                 license_text, description) = _decode_headers(
+                    rpm.headers, 'name', 'version', 'release', 'url', 'arch',
+                    'sourcerpm', 'copyright', 'description')
+
+                # 提取发起者名称、判断是否为组织及更新发起者列表
+                originator_name, is_organization, originators = extract_originator_name(
+                    homepage, originators)
+
+                suppliers = get_suppliers(
+                    release, homepage, originator_name, RPM_SUPPLIERS)
+
+                # 创建Package对象
+                package = Package(name, version, release,
+                                  architecture, "rpm", "SHA1", package_sha1)
+
+                # 设置源码包名
+                package.set_source(src_rpm)
+
+                # 获取许可证信息
+                licenses = rpm_licenses_scanner(license_text)
+                for license_info in licenses:
+                    package.add_license(license_info.get("id"))
+
+                # 设置供应商信息
+                for supplier in suppliers:
+                    package.add_supplier(supplier)
+
+                # 设置描述信息
+                package.set_description(description)
+
+                # 获取依赖信息（保持头部中的顺序去重）
+                for dep in _decode_header_list(rpm.headers.get('requirename')):
+                    package.add_declared_dep(dep)
+
+                # 获取文件信息
+                files = rpm_files_scanner(rpm.headers)
+                for file_info in files:
+                    package.add_file(file_info)
+
+                provides = {
+                    "id": package.id,
+                    "provides": _decode_header_list(rpm.headers.get('provides')),
+                }
 
         return package, licenses, originators, provides
 
@@ -516,15 +514,35 @@ def _get_deb_info(deb_package):
     return deb_package.control.debcontrol()
 
 
-def _safe_decode(value):
+def _decode_headers(headers, *names):
+    """
+    批量读取并解码 RPM 头部中的字符串字段。
+
+    Args:
+        headers (dict): rpmfile 解析得到的头部字典。
+        *names (str): 需要读取的头部字段名。
+
+    Returns:
+        tuple: 按字段名顺序排列的 UTF-8 字符串。字段不存在时对应位置为空字符串。
+    """
+
+    return tuple((headers.get(name) or b'').decode('utf-8') for name in names)
+
+
+def _decode_header_list(values):
     """
-    安全地将字节串解码为 UTF-8 编码的字符串。
+    将 RPM 头部中的列表字段解码为按原顺序去重的字符串列表。
 
     Args:
-        value (bytes or str): 需要解码的字节串或字符串。
+        values (list or bytes or None): RPM 头部字段值。字段只有一个元素时 rpmfile 可能直接返回字节串。
 
     Returns:
-        str: 解码后的字符串。如果输入值为 `None`，则返回空字符串。
+        list: 解码并去重后的字符串列表，不含空条目。字段不存在时返回空列表。
     """
 
-    return value.decode('utf-8') if value is not None else ''
+    if values is None:
+        return []
+    if isinstance(values, bytes):
+        values = [values]
+    # 直接内联解码并跳过空条目，避免去重结果中混入空字符串
+    return list(dict.fromkeys(value.decode('utf-8') for value in values if value))
@@ -81,20 +81,34 @@ def get_rpm_relationships(
     """
 
     relationships = []
+
+    # 构建 provides 能力到提供者ID列表的倒排索引，依赖查找由线性扫描变为字典查找
+    # 部分仓库会重复给出完全相同的提供者条目，先按 (ID, provides 集合) 去重，缩小索引
+    provides_index = {}
+    indexed_providers = set()
+    for provide_relationship in provides_relationships:
+        related_element = provide_relationship.get('id')
+        provides = provide_relationship.get("provides", [])
+        provider_key = (related_element, frozenset(provides))
+        if provider_key in indexed_providers:
+            continue
+        indexed_providers.add(provider_key)
+        for provide in provides:
+            provides_index.setdefault(provide, []).append(related_element)
+
     # 根据 disable_tqdm 决定是否使用 tqdm
     package_iter = tqdm(packages, desc="处理包依赖关系",
                         unit="包") if not disable_tqdm else packages
 
     for package in package_iter:
-        added_relationships = []
+        package_id = package.get('id')
+        added_relationships = set()
         for dep in package.get('depends', []):
-            for provide_relationship in provides_relationships:
-                provides = provide_relationship.get("provides", [])
-                related_element = provide_relationship.get('id')
-                if dep in provides and related_element not in added_relationships and related_element != package.get('id'):
-                    added_relationships.append(related_element)
+            for related_element in provides_index.get(dep, ()):
+                if related_element not in added_relationships and related_element != package_id:
+                    added_relationships.add(related_element)
                     relationships.append({
-                        "id": package.get('id'),
+                        "id": package_id,
                         "related_element": related_element,
                         "relationship_type": "DEPENDS_ON"
                     })
@@ -15,23 +15,44 @@
 from actions import ASSIST_DIR
 from actions.package import Package
 from actions.sbom_helper import build_sbom_header
-from actions.data_helper import read_data_from_json, save_data_to_json, remove_duplicates
+from actions.data_helper import read_data_from_json, save_data_to_json
 from actions.scanner.suppliers_helper import get_suppliers, RPM_SUPPLIERS, DEB_SUPPLIERS
 from actions.scanner.originators_helper import extract_originator_name
 from actions.licenses_helper import rpm_licenses_scanner
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
-import xml.etree.ElementTree as ET
+from lxml import etree
 from tqdm import tqdm
 import gzip
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 import requests
 import zstandard
 import os
 import logging
+import threading
 
 REQUEST_TIMEOUT = 10
+METADATA_FETCH_WORKERS = 3
+# 每个线程各自持有一个 Session 复用 TCP/TLS 连接，避免对同一仓库的多次请求重复握手；
+# requests.Session 不保证线程安全，因此不在下载线程之间共享
+_THREAD_LOCAL = threading.local()
+PRIMARY_NS = "{http://linux.duke.edu/metadata/common}"
+RPM_NS = "{http://linux.duke.edu/metadata/rpm}"
+PRIMARY_PACKAGE_TAG = f"{PRIMARY_NS}package"
+PRIMARY_NAME_TAG = f"{PRIMARY_NS}name"
+PRIMARY_VERSION_TAG = f"{PRIMARY_NS}version"
+PRIMARY_ARCH_TAG = f"{PRIMARY_NS}arch"
+PRIMARY_URL_TAG = f"{PRIMARY_NS}url"
+PRIMARY_CHECKSUM_TAG = f"{PRIMARY_NS}checksum"
+PRIMARY_DESCRIPTION_TAG = f"{PRIMARY_NS}description"
+PRIMARY_FORMAT_TAG = f"{PRIMARY_NS}format"
+RPM_SOURCERPM_TAG = f"{RPM_NS}sourcerpm"
+RPM_LICENSE_TAG = f"{RPM_NS}license"
+RPM_REQUIRES_XPATH = etree.XPath(
+    "rpm:requires/rpm:entry/@name", namespaces={"rpm": "http://linux.duke.edu/metadata/rpm"})
 
 
 def rpm_repo_scanner(
@@ -50,6 +71,10 @@ def rpm_repo_scanner(
 
     Returns:
         dict: 包含软件包和许可证 SBOM 的字典。
+
+    Raises:
+        requests.exceptions.RequestException: 下载 primary.xml 失败时抛出。
+        etree.XMLSyntaxError: primary.xml 解析失败时抛出。
     """
 
     packages = []
@@ -57,11 +82,18 @@ def rpm_repo_scanner(
     originators_file_path = os.path.join(ASSIST_DIR, 'originators.json')
     originators = read_data_from_json(originators_file_path)
 
-    metadata = _fetch_and_extract_metadata(primary_xml_url)
-    if metadata:
-        packages, licenses, originators = _parse_primary_xml(
-            metadata, originators, disable_tqdm)
-    
+    # 下载、解压与解析流水线进行，primary.xml 不在内存中整体展开；
+    # 中途失败时已解析的软件包并不完整，直接抛出异常而不是生成残缺的 SBOM
+    try:
+        with _open_metadata_stream(primary_xml_url) as stream:
+            if stream is not None:
+                packages, licenses, originators = _parse_primary_xml(
+                    stream, originators, disable_tqdm)
+    except (requests.exceptions.RequestException, Urllib3HTTPError,
+            OSError, zstandard.ZstdError, etree.XMLSyntaxError) as e:
+        logging.error(f"下载或解析 {primary_xml_url} 失败: {e}")
+        raise
+
     packages_sbom = [package.get_json() for package in packages]
 
     linx_sbom = {
@@ -98,8 +130,11 @@ def deb_repo_scanner(
     originators_file_path = os.path.join(ASSIST_DIR, 'originators.json')
     originators = read_data_from_json(originators_file_path)
 
-    for sources_url in sources_url_list:
-        metadata = _fetch_and_extract_metadata(sources_url)
+    # 并发下载各组件的 Sources 文件，解析仍按原顺序进行
+    with ThreadPoolExecutor(max_workers=METADATA_FETCH_WORKERS) as executor:
+        metadata_list = list(executor.map(_fetch_and_extract_metadata, sources_url_list))
+
+    for metadata in metadata_list:
         if metadata:
             packages_, licenses_, originators = _parse_sources(
                 metadata, originators, disable_tqdm)
@@ -135,9 +170,9 @@ def find_primary_xml_in_repo(repo_url: str) -> Optional[str]:
             repo_url += '/'
 
         repomd_url = urljoin(repo_url, "repodata/repomd.xml")
-        response = requests.get(repomd_url, timeout=REQUEST_TIMEOUT)
+        response = _get_session().get(repomd_url, timeout=REQUEST_TIMEOUT)
         if response.ok:
-            root = ET.fromstring(response.content)
+            root = etree.fromstring(response.content)
             namespaces = {"repo": "http://linux.duke.edu/metadata/repo"}
             for data in root.findall("repo:data", namespaces):
                 if data.attrib.get("type") != "primary":
@@ -147,7 +182,7 @@ def find_primary_xml_in_repo(repo_url: str) -> Optional[str]:
                 if href:
                     return urljoin(repo_url, href)
 
-        response = requests.get(repo_url, timeout=REQUEST_TIMEOUT)
+        response = _get_session().get(repo_url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -161,7 +196,7 @@ def find_primary_xml_in_repo(repo_url: str) -> Optional[str]:
             logging.error(f"未在仓库 {repo_url} 中找到 repodata 目录")
             return None
 
-        response = requests.get(repodata_link, timeout=REQUEST_TIMEOUT)
+        response = _get_session().get(repodata_link, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -172,7 +207,7 @@ def find_primary_xml_in_repo(repo_url: str) -> Optional[str]:
         logging.error(f"未在 {repodata_link} 中找到 primary.xml 元数据")
         return None
 
-    except (ET.ParseError, requests.exceptions.RequestException) as e:
+    except (etree.XMLSyntaxError, requests.exceptions.RequestException) as e:
         logging.error(f"获取repodata时发生错误: {e}")
         return None
 
@@ -204,7 +239,7 @@ def find_deb_sources_in_repo(repo_url: str) -> Optional[str]:
                 component_url = urljoin(repo_url, f"{component}/")
 
                 # 尝试访问组件目录
-                response = requests.get(component_url, timeout=REQUEST_TIMEOUT)
+                response = _get_session().get(component_url, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
 
                 # 如果组件目录存在，查找其中的source目录
@@ -220,7 +255,7 @@ def find_deb_sources_in_repo(repo_url: str) -> Optional[str]:
 
                 if source_link:
                     # 访问source目录，查找Sources文件
-                    source_response = requests.get(source_link, timeout=REQUEST_TIMEOUT)
+                    source_response = _get_session().get(source_link, timeout=REQUEST_TIMEOUT)
                     source_response.raise_for_status()
                     source_soup = BeautifulSoup(
                         source_response.text, "html.parser")
@@ -276,48 +311,72 @@ def _fetch_and_extract_metadata(metadata_url: str) -> Optional[bytes]:
         bytes | None: 解压后的元数据内容。下载或解压失败时返回 None。
     """
 
-
     try:
-        response = requests.get(metadata_url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
+        with _open_metadata_stream(metadata_url) as stream:
+            if stream is None:
+                return None
+            return stream.read()
 
-        content = response.content
+    except gzip.BadGzipFile as e:
+        logging.error(f"解压gzip失败: {e}")
+        return None
+    except zstandard.ZstdError as e:
+        logging.error(f"解压zst失败: {e}")
+        return None
+    except (requests.exceptions.RequestException, Urllib3HTTPError) as e:
+        logging.error(f"下载失败: {e}")
+        return None
 
-        if metadata_url.endswith('.gz'):
-            try:
-                with gzip.GzipFile(fileobj=BytesIO(content)) as f:
-                    return f.read()
-            except gzip.BadGzipFile as e:
-                logging.error(f"解压gzip失败: {e}")
-                return None
 
-        elif metadata_url.endswith('.zst'):
-            try:
-                # 流式解压
-                dctx = zstandard.ZstdDecompressor()
-                decompressed = bytearray()
-                with dctx.stream_reader(BytesIO(content)) as reader:
-                    while True:
-                        chunk = reader.read(16384)
-                        if not chunk:
-                            break
-                        decompressed.extend(chunk)
-                return bytes(decompressed)
-            except zstandard.ZstdError as e:
-                logging.error(f"解压zst失败: {e}")
-                return None
+def _get_session() -> requests.Session:
+    """获取当前线程的 requests.Session，首次调用时创建。
 
-        else:
-            logging.error(f"不支持的格式: {metadata_url}")
-            return None
+    Returns:
+        requests.Session: 当前线程专用的会话。
+    """
 
-    except requests.exceptions.RequestException as e:
-        logging.error(f"下载失败: {e}")
-        return None
+    session = getattr(_THREAD_LOCAL, "session", None)
+    if session is None:
+        session = _THREAD_LOCAL.session = requests.Session()
+    return session
+
+
+@contextmanager
+def _open_metadata_stream(metadata_url: str) -> Iterator[Optional[BinaryIO]]:
+    """
+    打开仓库元数据文件的解压流。
+
+    下载、解压与调用方的读取按需交替进行，压缩数据和解压后的数据都不会在内存中整体缓存。
+
+    Args:
+        metadata_url (str): 元数据文件 URL，支持 .gz 与 .zst。
+
+    Yields:
+        BinaryIO | None: 解压后的只读二进制流。格式不受支持时为 None。
+
+    Raises:
+        requests.exceptions.RequestException: 请求失败时抛出。
+    """
+
+    if not metadata_url.endswith(('.gz', '.zst')):
+        logging.error(f"不支持的格式: {metadata_url}")
+        yield None
+        return
+
+    with _get_session().get(metadata_url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        if metadata_url.endswith('.gz'):
+            with gzip.GzipFile(fileobj=response.raw) as stream:
+                yield stream
+        else:
+            with zstandard.ZstdDecompressor().stream_reader(response.raw) as stream:
+                yield stream
 
 
 def _parse_primary_xml(
-    xml_data: bytes,
+    xml_stream: BinaryIO,
     originators: List[Dict[str, Any]],
     disable_tqdm: bool = False
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
@@ -325,7 +384,7 @@ def _parse_primary_xml(
     解析 primary.xml 数据并提取软件包和许可证信息。
 
     Args:
-        xml_data (bytes): primary.xml 文件的解压后数据。
+        xml_stream (BinaryIO): 解压后的 primary.xml 二进制流。
         originators (list): 发起者信息列表。
         disable_tqdm (bool): 是否禁用tqdm进度条，默认为False显示进度条。
 
@@ -336,41 +395,32 @@ def _parse_primary_xml(
             - originators (list): 更新后的发起者信息列表。
     """
 
-    tree = ET.ElementTree(ET.fromstring(xml_data))
-    root = tree.getroot()
-
-    namespaces = {
-        "ns0": "http://linux.duke.edu/metadata/common",
-        "rpm": "http://linux.duke.edu/metadata/rpm"
-    }
-
     packages = []
-    licenses = []
+    # 许可证在仓库内大量重复，按 ID 即时去重，避免累积后再整体扫描
+    licenses = {}
 
-    for package_metadata in tqdm(root.findall("ns0:package", namespaces), disable=disable_tqdm):
+    for package_metadata in tqdm(_iter_primary_packages(xml_stream), disable=disable_tqdm, unit="包"):
         try:
-            name = package_metadata.findtext("ns0:name", namespaces=namespaces)
-            ver = package_metadata.find(
-                "ns0:version", namespaces).attrib.get("ver", '')
-            rel = package_metadata.find(
-                "ns0:version", namespaces).attrib.get("rel", '')
-            arch = package_metadata.findtext(
-                "ns0:arch", namespaces=namespaces)
-
-            homepage = package_metadata.findtext(
-                "ns0:url", namespaces=namespaces)
+            name = package_metadata.findtext(PRIMARY_NAME_TAG)
+            version_element = package_metadata.find(PRIMARY_VERSION_TAG)
+            ver = version_element.attrib.get("ver", '')
+            rel = version_element.attrib.get("rel", '')
+            arch = package_metadata.findtext(PRIMARY_ARCH_TAG)
+
+            homepage = package_metadata.findtext(PRIMARY_URL_TAG)
             originator_name, is_organization, originators = extract_originator_name(
                 homepage, originators)
             suppliers = get_suppliers(
                 rel, homepage, originator_name, RPM_SUPPLIERS)
 
-            checksum_algorithm = package_metadata.find(
-                "ns0:checksum", namespaces).attrib.get("type", '')
-            checksum = package_metadata.findtext(
-                "ns0:checksum", namespaces=namespaces)
-            
-            source = package_metadata.findtext(
-                "ns0:format/rpm:sourcerpm", namespaces=namespaces)
+            checksum_element = package_metadata.find(PRIMARY_CHECKSUM_TAG)
+            checksum_algorithm = checksum_element.attrib.get("type", '')
+            checksum = checksum_element.text or ''
+
+            format_element = package_metadata.find(PRIMARY_FORMAT_TAG)
+            if format_element is None:
+                format_element = etree.Element(PRIMARY_FORMAT_TAG)
+            source = format_element.findtext(RPM_SOURCERPM_TAG)
 
             # 创建Package对象
             package = Package(name, ver, rel, arch, "rpm", checksum_algorithm, checksum)
@@ -379,23 +429,21 @@ def _parse_primary_xml(
             package.set_source(source)
 
             # 获取许可证信息
-            licenses_ = rpm_licenses_scanner(package_metadata.findtext(
-                "ns0:format/rpm:license", namespaces=namespaces))
+            licenses_ = rpm_licenses_scanner(format_element.findtext(RPM_LICENSE_TAG))
             for license in licenses_:
                 package.add_license(license.get("id"))
-            licenses.extend(licenses_)
+                licenses.setdefault(license.get("id"), license)
 
             # 设置供应商信息
             for supplier in suppliers:
                 package.add_supplier(supplier)
             
             # 设置描述信息
-            package.set_description(package_metadata.findtext(
-                "ns0:description", namespaces=namespaces))
+            package.set_description(package_metadata.findtext(PRIMARY_DESCRIPTION_TAG))
             
             # 获取依赖信息
-            for require in package_metadata.findall("ns0:format/rpm:requires/rpm:entry", namespaces):
-                package.add_declared_dep(require.attrib.get("name", None))
+            for require_name in RPM_REQUIRES_XPATH(format_element):
+                package.add_declared_dep(str(require_name))
 
             packages.append(package)
 
@@ -403,8 +451,29 @@ def _parse_primary_xml(
             logging.error(f"解析包 {name} 时发生错误: {e}")
             continue
 
-    licenses = remove_duplicates(licenses)
-    return packages, licenses, originators
+    return packages, list(licenses.values()), originators
+
+
+def _iter_primary_packages(xml_stream: BinaryIO) -> Iterator[etree._Element]:
+    """
+    流式解析 primary.xml，逐个产出 package 元素。
+
+    每个 package 元素在调用方处理完毕后立即清空，内存占用不再随整个 XML 文档的大小增长。
+
+    Args:
+        xml_stream (BinaryIO): 解压后的 primary.xml 二进制流。
+
+    Yields:
+        lxml.etree._Element: 完整解析的 package 元素。
+    """
+
+    for _, element in etree.iterparse(
+            xml_stream, events=("end",), tag=PRIMARY_PACKAGE_TAG, resolve_entities=False):
+        yield element
+        element.clear()
+        # 同时释放根节点下已处理完毕的兄弟节点
+        while element.getprevious() is not None:
+            del element.getparent()[0]
 
 
 def _parse_sources(
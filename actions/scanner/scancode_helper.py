@@ -14,27 +14,46 @@
 
 
 import tempfile
+import io
 import os
 import shutil
 import logging
-import hashlib
 import tarfile
 import zipfile
-import json
 import subprocess
+import re
 import libarchive
 from tqdm import tqdm
 from multiprocessing import Pool
-from fnmatch import fnmatch
-from typing import Any, Dict, List, Tuple, Optional
+from fnmatch import translate
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Tuple, Optional
 from scancode import api as scancode
 from actions import OSV_SCANNER
 from actions.data_helper import (
     calculate_md5,
-    remove_duplicates
+    read_data_from_json,
+    remove_duplicates,
+    short_id
 )
 from actions.licenses_helper import rpm_licenses_scanner
 
+# 源码扫描进程池单批任务数上限
+SCAN_TASK_CHUNKSIZE = 32
+# 用于判断二进制文件的文件头长度
+BINARY_SNIFF_SIZE = 4096
+# 去重时先比较的文件头长度，文件头也相同时才计算完整 MD5
+DUPLICATE_HEAD_SIZE = 4096
+# 查找许可证/版权关键词时单次读取的字节数
+LICENSE_HINT_CHUNK_SIZE = 1 << 20
+# 相邻读取块之间保留的重叠字节数，需不小于最长关键词长度，避免关键词跨块时漏检
+LICENSE_HINT_OVERLAP = 64
+# 许可证/版权声明中常见的关键词，文件中不含任何关键词时跳过 ScanCode 检测
+LICENSE_HINT_RE = re.compile(
+    rb"copyright|licen[cs]e|spdx|gpl|\(c\)|\xc2\xa9|permission is hereby granted"
+    rb"|redistribution|warrant|public domain|all rights reserved",
+    re.IGNORECASE)
+
 
 def _safe_join(base_dir: str, member_name: str) -> Optional[str]:
     """安全拼接解压目标路径。
@@ -67,6 +86,8 @@ def _extract_src_rpm(src_rpm_path: str) -> str:
     """
     解压 .src.rpm 文件并提取其中的源代码压缩文件，返回解压后的源代码目录路径。
 
+    源代码压缩文件直接从 .src.rpm 中流式读取并解压，不再先落盘到中间临时目录。
+
     Args:
         src_rpm_path (str): .src.rpm 文件的路径。
 
@@ -77,62 +98,71 @@ def _extract_src_rpm(src_rpm_path: str) -> str:
         ValueError: 如果未在 .src.rpm 文件中找到源代码压缩文件。
     """
 
-    # 创建一个临时目录用于解压 .src.rpm 文件
-    temp_dir = tempfile.mkdtemp()
+    with libarchive.file_reader(src_rpm_path) as archive:
+        for entry in archive:
+            if not entry.isfile or not entry.pathname.endswith(('.tar.xz', '.tar.gz', '.tgz', '.tar.bz2')):
+                continue
+
+            # 创建一个临时目录用于解压源代码压缩文件
+            source_dir = tempfile.mkdtemp()
+            try:
+                with libarchive.stream_reader(_ArchiveEntryStream(entry.get_blocks())) as source_archive:
+                    _extract_libarchive_entries(source_archive, source_dir)
+            except Exception:
+                shutil.rmtree(source_dir, ignore_errors=True)
+                raise
+
+            # 返回解压后的源代码目录路径
+            return source_dir
 
-    try:
-        # 解压 .src.rpm 文件
-        with libarchive.file_reader(src_rpm_path) as archive:
-            for entry in archive:
-                pathname = _safe_join(temp_dir, entry.pathname)
-                if pathname is None:
-                    continue
-                if entry.isdir:
-                    os.makedirs(pathname, exist_ok=True)
-                elif entry.isfile:
-                    parent_dir = os.path.dirname(pathname)
-                    os.makedirs(parent_dir, exist_ok=True)
-                    with open(pathname, 'wb') as f:
-                        for block in entry.get_blocks():
-                            f.write(block)
-
-        # 在解压后的文件中查找源代码压缩文件
-        source_archive = None
-        for root, dirs, files in os.walk(temp_dir):
-            for file in files:
-                if file.endswith(('.tar.xz', '.tar.gz', '.tgz', '.tar.bz2')):
-                    source_archive = os.path.join(root, file)
-                    break
-            if source_archive:
-                break
+    raise ValueError("未在 .src.rpm 文件中找到源代码压缩文件")
 
-        if not source_archive:
-            raise ValueError("未在 .src.rpm 文件中找到源代码压缩文件")
-
-        # 创建一个临时目录用于解压源代码压缩文件
-        source_dir = tempfile.mkdtemp()
-
-        # 解压源代码压缩文件
-        with libarchive.file_reader(source_archive) as archive:
-            for entry in archive:
-                pathname = _safe_join(source_dir, entry.pathname)
-                if pathname is None:
-                    continue
-                if entry.isdir:
-                    os.makedirs(pathname, exist_ok=True)
-                elif entry.isfile:
-                    parent_dir = os.path.dirname(pathname)
-                    os.makedirs(parent_dir, exist_ok=True)
-                    with open(pathname, 'wb') as f:
-                        for block in entry.get_blocks():
-                            f.write(block)
 
-        # 返回解压后的源代码目录路径
-        return source_dir
+class _ArchiveEntryStream(io.RawIOBase):
+    """将 libarchive 归档成员的数据块包装为只读流，供嵌套归档直接读取。"""
 
-    finally:
-        # 清理 .src.rpm 的临时目录
-        shutil.rmtree(temp_dir)
+    def __init__(self, blocks: Iterator[bytes]):
+        self._blocks = blocks
+        self._pending = memoryview(b"")
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        # 记录当前数据块内的读取偏移，块读完后才取下一块，避免每次读取都复制剩余数据
+        while self._offset >= len(self._pending):
+            block = next(self._blocks, None)
+            if block is None:
+                return 0
+            self._pending = memoryview(block)
+            self._offset = 0
+        size = min(len(buffer), len(self._pending) - self._offset)
+        buffer[:size] = self._pending[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+
+def _extract_libarchive_entries(archive, target_dir: str) -> None:
+    """将 libarchive 归档中的目录和普通文件安全解压到目标目录。
+
+    Args:
+        archive (libarchive.read.ArchiveRead): 已打开的归档。
+        target_dir (str): 解压目标目录。
+    """
+
+    for entry in archive:
+        pathname = _safe_join(target_dir, entry.pathname)
+        if pathname is None:
+            continue
+        if entry.isdir:
+            os.makedirs(pathname, exist_ok=True)
+        elif entry.isfile:
+            parent_dir = os.path.dirname(pathname)
+            os.makedirs(parent_dir, exist_ok=True)
+            with open(pathname, 'wb') as f:
+                for block in entry.get_blocks():
+                    f.write(block)
 
 
 def _should_include(member_name: str, include_patterns: Optional[List[str]], exclude_patterns: Optional[List[str]]) -> bool:
@@ -149,10 +179,10 @@ def _should_include(member_name: str, include_patterns: Optional[List[str]], exc
     """
 
     if include_patterns:
-        if not any(fnmatch(member_name, pattern) for pattern in include_patterns):
+        if not _compile_patterns(tuple(include_patterns)).match(member_name):
             return False
     if exclude_patterns:
-        if any(fnmatch(member_name, pattern) for pattern in exclude_patterns):
+        if _compile_patterns(tuple(exclude_patterns)).match(member_name):
             return False
     return True
 
@@ -160,6 +190,9 @@ def _should_include(member_name: str, include_patterns: Optional[List[str]], exc
 def _should_skip_directory(member_name: str, exclude_patterns: Optional[List[str]]) -> bool:
     """判断目录是否应被排除。
 
+    以 `/*` 或 `/**` 结尾的排除模式会排除目录下的全部内容（通配符 `*` 可以匹配 `/`），
+    因此目录本身命中去掉该后缀的模式时，同样无需进入该目录。
+
     Args:
         member_name (str): 源码目录内的相对目录路径。
         exclude_patterns (list[str] | None): 排除模式列表。
@@ -168,7 +201,45 @@ def _should_skip_directory(member_name: str, exclude_patterns: Optional[List[str
         bool: 目录命中排除模式时返回 True。
     """
 
-    return bool(exclude_patterns and any(fnmatch(member_name, pattern) for pattern in exclude_patterns))
+    return bool(exclude_patterns and _compile_patterns(
+        _directory_exclude_patterns(tuple(exclude_patterns))).match(member_name))
+
+
+@lru_cache(maxsize=32)
+def _directory_exclude_patterns(exclude_patterns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """由排除模式推导出用于目录剪枝的模式。
+
+    Args:
+        exclude_patterns (tuple[str, ...]): 排除模式。
+
+    Returns:
+        tuple[str, ...]: 原有模式及去掉 `/*`、`/**` 后缀得到的目录模式。
+    """
+
+    directory_patterns = list(exclude_patterns)
+    for pattern in exclude_patterns:
+        for suffix in ('/**', '/*'):
+            if pattern.endswith(suffix) and len(pattern) > len(suffix):
+                directory_patterns.append(pattern[:-len(suffix)])
+                break
+    return tuple(directory_patterns)
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...]) -> re.Pattern:
+    """将一组通配符模式合并编译为单个正则表达式。
+
+    每个文件只需一次正则匹配，而不是对每个模式分别调用 fnmatch。
+
+    Args:
+        patterns (tuple[str, ...]): 通配符模式。
+
+    Returns:
+        re.Pattern: 命中任一模式即可匹配的正则表达式，匹配规则与 fnmatch 一致。
+    """
+
+    return re.compile("|".join(
+        f"(?:{translate(pattern)})" for pattern in patterns))
 
 
 def _relative_source_path(source_dir: str, member_path: str) -> str:
@@ -185,12 +256,12 @@ def _relative_source_path(source_dir: str, member_path: str) -> str:
     return os.path.relpath(member_path, source_dir).replace(os.sep, "/")
 
 
-def _process_member(member: Tuple[str, str]) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+def _process_member(member: Tuple[str, str, int, Optional[str]]) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
     """
     处理指定的文件成员，提取其许可证、版权信息以及其他元数据。
 
     Args:
-        member (tuple[str, str]): 源码根目录和待处理文件路径。
+        member (tuple[str, str, int, str | None]): 源码根目录、待处理文件路径、文件大小以及已计算的文件 MD5（未计算时为 None）。
 
     Returns:
         tuple: 包含两个元素：
@@ -204,22 +275,25 @@ def _process_member(member: Tuple[str, str]) -> Tuple[Optional[Dict[str, Any]],
             - license_id_list (list of str): 许可证扫描器返回的许可证ID列表。
     """
 
-    source_dir, member_path = member
+    source_dir, member_path, _, file_md5 = member
     try:
-        licenses = scancode.get_licenses(location=member_path, include_text=True)
-        copyright_data = scancode.get_copyrights(location=member_path)
+        if _needs_license_scan(member_path):
+            licenses = scancode.get_licenses(location=member_path, include_text=True)
+            copyright_data = scancode.get_copyrights(location=member_path)
+        else:
+            licenses = {}
+            copyright_data = {}
     except Exception as e:
         logging.error(f"处理源码文件失败: {member_path} - {e}")
         return None, []
 
     detected_license_expression_spdx = licenses.get(
         'detected_license_expression_spdx')
-    holders = list(set(item['holder']
-                   for item in copyright_data.get('holders', [])))
+    # 按首次出现顺序去重，保证生成的 SBOM 可复现
+    holders = list(dict.fromkeys(
+        item['holder'] for item in copyright_data.get('holders', [])))
 
-    processed_file_path = _relative_source_path(source_dir, member_path)
-    id_md5 = hashlib.md5(processed_file_path.encode()).hexdigest()[:12]
-    name = os.path.basename(member_path)
+    file_id, name, processed_file_path = _file_identity(source_dir, member_path)
     if detected_license_expression_spdx:
         licenses = rpm_licenses_scanner(detected_license_expression_spdx)
         license_id_list = [license.get("id") for license in licenses]
@@ -227,11 +301,12 @@ def _process_member(member: Tuple[str, str]) -> Tuple[Optional[Dict[str, Any]],
         licenses = []
         license_id_list = []
 
-    with open(member_path, 'rb') as f:
-        file_md5 = calculate_md5(f)
+    # 去重阶段已计算过 MD5 的文件直接复用，避免重复读取文件
+    if file_md5 is None:
+        file_md5 = calculate_md5(member_path)
 
     file_info = {
-        "id": f"File-{name}-{id_md5}",
+        "id": file_id,
         "name": name,
         "path": processed_file_path,
         "licenses": license_id_list,
@@ -245,6 +320,225 @@ def _process_member(member: Tuple[str, str]) -> Tuple[Optional[Dict[str, Any]],
     return file_info, licenses
 
 
+def _needs_license_scan(member_path: str) -> bool:
+    """判断文件是否需要交给 ScanCode 检测许可证和版权。
+
+    ScanCode 检测是源码扫描中最耗时的部分，二进制文件以及不含任何许可证/版权关键词的文件直接跳过。
+    关键词按块读取查找，大文件无需整体读入内存。
+
+    Args:
+        member_path (str): 待处理文件路径。
+
+    Returns:
+        bool: 需要执行 ScanCode 检测时返回 True。
+    """
+
+    with open(member_path, 'rb') as f:
+        chunk = f.read(BINARY_SNIFF_SIZE)
+        if b"\0" in chunk:
+            return False
+        tail = b""
+        while chunk:
+            window = tail + chunk
+            if LICENSE_HINT_RE.search(window) is not None:
+                return True
+            tail = window[-LICENSE_HINT_OVERLAP:]
+            chunk = f.read(LICENSE_HINT_CHUNK_SIZE)
+    return False
+
+
+def _iter_source_files(
+    source_dir: str,
+    include: Optional[List[str]],
+    exclude: Optional[List[str]]
+) -> Iterator[str]:
+    """遍历源码目录，产出需要扫描的文件路径。
+
+    基于 os.scandir 遍历，相对路径随目录层级拼接得到，无需对每个条目调用 relpath；
+    命中排除模式的目录不会被进入，例如排除模式 `.git/*` 会跳过整个 .git 目录。
+
+    Args:
+        source_dir (str): 源码根目录。
+        include (list[str] | None): 要包含的文件模式。
+        exclude (list[str] | None): 要排除的文件模式。
+
+    Yields:
+        str: 待扫描文件的路径。
+    """
+
+    pending = [(source_dir, "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                entries = list(iterator)
+        except OSError:
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            relative_path = prefix + entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # 与 os.walk 默认行为一致，不进入指向目录的符号链接
+                if not entry.is_symlink() and not _should_skip_directory(relative_path, exclude):
+                    subdirectories.append((entry.path, relative_path + "/"))
+            elif _should_include(relative_path, include, exclude):
+                yield entry.path
+        pending.extend(reversed(subdirectories))
+
+
+def _file_identity(source_dir: str, member_path: str) -> Tuple[str, str, str]:
+    """生成源码文件的 ID、文件名和相对路径。
+
+    Args:
+        source_dir (str): 源码根目录。
+        member_path (str): 文件实际路径。
+
+    Returns:
+        tuple: 文件 ID、文件名和源码目录内的相对路径。
+    """
+
+    processed_file_path = _relative_source_path(source_dir, member_path)
+    id_md5 = short_id(processed_file_path)
+    name = os.path.basename(member_path)
+    return f"File-{name}-{id_md5}", name, processed_file_path
+
+
+def _group_duplicate_members(
+    members: List[Tuple[str, str, int, Optional[str]]]
+) -> Tuple[List[Tuple[str, str, int, Optional[str]]], Dict[str, List[Tuple[str, str, int, Optional[str]]]]]:
+    """按文件内容对待扫描文件去重。
+
+    先按文件大小分组，大小相同的文件再比较文件头，只有大小和文件头都相同的文件才计算完整 MD5 比较内容，
+    计算出的 MD5 写入成员中供后续处理复用。
+
+    Args:
+        members (list[tuple[str, str, int, str | None]]): 源码根目录、待处理文件路径、文件大小和文件 MD5 组成的列表。
+
+    Returns:
+        tuple: 包含两个元素：
+            - unique_members (list): 需要实际扫描的文件成员。
+            - duplicates (dict): 键为被扫描文件的相对路径，值为与其内容相同的其他文件成员。
+    """
+
+    members_by_size = {}
+    for member in members:
+        members_by_size.setdefault(member[2], []).append(member)
+
+    candidate_groups = []
+    unique_members = []
+    for same_size_members in members_by_size.values():
+        if len(same_size_members) == 1:
+            unique_members.extend(same_size_members)
+            continue
+
+        members_by_head = {}
+        for member in same_size_members:
+            try:
+                with open(member[1], 'rb') as f:
+                    head = f.read(DUPLICATE_HEAD_SIZE)
+            except OSError:
+                unique_members.append(member)
+                continue
+            members_by_head.setdefault(head, []).append(member)
+        for same_head_members in members_by_head.values():
+            if len(same_head_members) == 1:
+                unique_members.extend(same_head_members)
+            else:
+                candidate_groups.append(same_head_members)
+
+    duplicates = {}
+    for candidate_members in candidate_groups:
+        representatives = {}
+        for member in candidate_members:
+            try:
+                file_md5 = calculate_md5(member[1])
+            except OSError:
+                unique_members.append(member)
+                continue
+            member = (member[0], member[1], member[2], file_md5)
+            representative = representatives.setdefault(file_md5, member)
+            if representative is member:
+                unique_members.append(member)
+            else:
+                duplicates.setdefault(
+                    _relative_source_path(representative[0], representative[1]), []).append(member)
+    return unique_members, duplicates
+
+
+def _copy_file_info(file_info: Dict[str, Any], member: Tuple[str, str, int, Optional[str]]) -> Dict[str, Any]:
+    """为内容相同的文件复制扫描结果，并替换为该文件自身的 ID、文件名和路径。
+
+    Args:
+        file_info (dict): 已扫描文件的信息。
+        member (tuple[str, str, int, str | None]): 源码根目录、内容相同的文件路径、文件大小和文件 MD5。
+
+    Returns:
+        dict: 该文件的信息。
+    """
+
+    file_id, name, processed_file_path = _file_identity(member[0], member[1])
+    return {
+        **file_info,
+        "id": file_id,
+        "name": name,
+        "path": processed_file_path,
+        "licenses": list(file_info["licenses"]),
+        "holders": list(file_info["holders"]),
+        "checksums": dict(file_info["checksums"]),
+    }
+
+
+def _process_member_batch(members: List[Tuple[str, str, int, Optional[str]]]) -> List[Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """在工作进程中依次处理一批文件成员。
+
+    Args:
+        members (list[tuple[str, str, int, str | None]]): 源码根目录、待处理文件路径、文件大小和文件 MD5 组成的列表。
+
+    Returns:
+        list: 每个成员对应的 `_process_member` 结果。
+    """
+
+    return [_process_member(member) for member in members]
+
+
+def _batch_members(members: List[Tuple[str, str, int, Optional[str]]], workers: int) -> List[List[Tuple[str, str, int, Optional[str]]]]:
+    """将待扫描文件按大小划分为任务批次。
+
+    文件按大小降序排列，最大的一批文件逐个分发并最先开始处理，避免耗时任务落在最后拖慢整体；
+    其余小文件按批分发，以摊薄进程间通信和任务调度开销。
+
+    Args:
+        members (list[tuple[str, str, int, str | None]]): 源码根目录、待处理文件路径、文件大小和文件 MD5 组成的列表。
+        workers (int): 工作进程数。
+
+    Returns:
+        list: 任务批次列表。
+    """
+
+    members = sorted(members, key=lambda member: member[2], reverse=True)
+    chunksize = max(1, min(SCAN_TASK_CHUNKSIZE, len(members) // (workers * 8)))
+    large_count = workers * 8
+    batches = [[member] for member in members[:large_count]]
+    batches.extend(
+        members[index:index + chunksize]
+        for index in range(large_count, len(members), chunksize))
+    return batches
+
+
+def _file_size(file_path: str) -> int:
+    """获取待扫描文件的大小，文件不可访问时视为 0。"""
+
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+
 def scan_src_dir(
     source_dir: str,
     include: Optional[List[str]],
@@ -269,19 +563,12 @@ def scan_src_dir(
     file_list = []
     license_list = []
 
-    for root, dirs, files in os.walk(source_dir):
-        dirs[:] = [
-            directory for directory in dirs
-            if not _should_skip_directory(
-                _relative_source_path(source_dir, os.path.join(root, directory)),
-                exclude)
-        ]
-        for file in files:
-            file_path = os.path.join(root, file)
-            relative_path = _relative_source_path(source_dir, file_path)
-            if _should_include(relative_path, include, exclude):
-                members.append((source_dir, file_path))
+    for file_path in _iter_source_files(source_dir, include, exclude):
+        # 文件大小只获取一次，去重分组和任务分批共用
+        members.append((source_dir, file_path, _file_size(file_path), None))
     total_files = len(members)
+    # 内容完全相同的文件只扫描一次，其余副本复用扫描结果
+    members, duplicates = _group_duplicate_members(members)
 
     if workers is None:
         logging.info("使用默认的线程数进行扫描")
@@ -289,12 +576,23 @@ def scan_src_dir(
     else:
         logging.info(f"使用 {workers} 个线程进行扫描")
 
-    with Pool(processes=workers) as pool:
-        for file_info, licenses in tqdm(pool.imap_unordered(_process_member, members), total=total_files, desc="扫描文件：", disable=disable_tqdm):
-            if file_info:
-                file_list.append(file_info)
-            if licenses:
-                license_list.extend(licenses)
+    with Pool(processes=workers) as pool, \
+            tqdm(total=total_files, desc="扫描文件：", disable=disable_tqdm) as progress:
+        while members:
+            for results in pool.imap_unordered(_process_member_batch, _batch_members(members, workers)):
+                completed = len(results)
+                for file_info, licenses in results:
+                    if file_info:
+                        file_list.append(file_info)
+                        copies = duplicates.pop(file_info["path"], [])
+                        file_list.extend(_copy_file_info(file_info, copy) for copy in copies)
+                        completed += len(copies)
+                    if licenses:
+                        license_list.extend(licenses)
+                progress.update(completed)
+            # 代表文件处理失败时无结果可复用，其内容相同的副本逐个单独处理
+            members = [copy for copies in duplicates.values() for copy in copies]
+            duplicates = {}
 
     license_list = remove_duplicates(license_list)
     file_list.sort(key=lambda x: x.get("id", ""))
@@ -398,8 +696,7 @@ def run_osv_dependency_scan(source_dir: str) -> Dict[str, Any]:
         if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
             logging.warning("OSV Scanner 未生成依赖扫描结果")
             return {}
-        with open(output_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return read_data_from_json(output_path)
     except Exception as e:
         logging.warning(f"OSV Scanner 依赖扫描失败: {e}")
         return {}
@@ -12,10 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from actions.data_helper import read_data_from_json
+from actions.sbom_helper import load_creators
 from typing import Any, Dict, List
-from actions import ASSIST_DIR
-import os
 
 
 def convert_to_spdx(
@@ -51,8 +49,6 @@ def convert_to_spdx(
         for license_info in linx_sbom.get('licenses_sbom', {}).get('licenses', [])
     ]
 
-    creators_file_path = os.path.join(ASSIST_DIR, 'creators.json')
-
     # 构建最终的 SPDX SBOM 字典
     spdx_sbom = {
         "spdxVersion": "SPDX-2.3",
@@ -62,7 +58,7 @@ def convert_to_spdx(
         "documentNamespace": filename,
         "creationInfo": {
             "licenseListVersion": "3.23",
-            "creators": read_data_from_json(creators_file_path),
+            "creators": list(load_creators()),
             "created": created_time
         },
         "packages": spdx_packages,
@@ -120,11 +116,13 @@ def _build_spdx_package(package: Dict[str, Any], package_type: str) -> Dict[str,
     purl_arch = f"?arch={architecture}" if architecture else ""
     checksum = package.get('checksum', {})
     purl_type = package.get('package_type') or package_type
+    name = package.get('name')
+    version = package.get('version')
 
     return {
-        "name": _no_assertion(package.get('name')),
+        "name": _no_assertion(name),
         "SPDXID": f"SPDXRef-{package.get('id')}",
-        "versionInfo": _no_assertion(package.get('version')),
+        "versionInfo": _no_assertion(version),
         "supplier": _format_supplier(supplier_name),
         "packageHomePage": _no_assertion(homepage),
         "packageDescription": _no_assertion(package.get('description')),
@@ -134,8 +132,7 @@ def _build_spdx_package(package: Dict[str, Any], package_type: str) -> Dict[str,
             {
                 "referenceCategory": "PACKAGE_MANAGER",
                 "referenceLocator": (
-                    f"pkg:{purl_type}/{package.get('name')}@"
-                    f"{package.get('version')}{purl_arch}"
+                    f"pkg:{purl_type}/{name}@{version}{purl_arch}"
                 ),
                 "referenceType": "purl",
             }
@@ -182,18 +179,18 @@ def _build_spdx_relationships(linx_sbom: Dict[str, Any]) -> List[Dict[str, Any]]
         list: SPDX relationship 元素列表。
     """
 
-    relationships = []
-    for group_name, data_name in (
-        ('file_relationships_sbom', 'file_relationships'),
-        ('package_relationships_sbom', 'package_relationships'),
-    ):
-        for relationship in linx_sbom.get(group_name, {}).get(data_name, []):
-            relationships.append({
-                "spdxElementId": f"SPDXRef-{relationship['id']}",
-                "relatedSpdxElement": f"SPDXRef-{relationship['related_element']}",
-                "relationshipType": relationship['relationship_type'],
-            })
-    return relationships
+    return [
+        {
+            "spdxElementId": f"SPDXRef-{relationship['id']}",
+            "relatedSpdxElement": f"SPDXRef-{relationship['related_element']}",
+            "relationshipType": relationship['relationship_type'],
+        }
+        for group_name, data_name in (
+            ('file_relationships_sbom', 'file_relationships'),
+            ('package_relationships_sbom', 'package_relationships'),
+        )
+        for relationship in linx_sbom.get(group_name, {}).get(data_name, [])
+    ]
 
 
 def _build_spdx_license(license_info: Dict[str, Any]) -> Dict[str, str]:
@@ -13,14 +13,15 @@
 # limitations under the License.
 
 import os
+import hashlib
 import tarfile
 import zipfile
 import rpmfile
-import hashlib
 import io
 import logging
 import re
-from typing import Dict, Any, Tuple, List, Callable
+from typing import Dict, Any, Iterable, Tuple, List, Callable, BinaryIO, Optional
+from actions.data_helper import calculate_md5, HASH_CHUNK_SIZE
 from actions.package import Package
 from actions.scanner.suppliers_helper import (
     get_suppliers,
@@ -30,6 +31,26 @@ from actions.scanner.suppliers_helper import (
 from actions.scanner.originators_helper import extract_originator_name
 from actions.licenses_helper import rpm_licenses_scanner
 
+# spec 文件前导区中需要提取的标签，标签名不区分大小写
+SPEC_TAG_RE = re.compile(
+    r'(name|version|release|license|url|buildrequires|requires|buildarch):', re.IGNORECASE)
+# 标签名与解析结果键名不一致的映射
+SPEC_TAG_KEYS = {'buildarch': 'architecture'}
+# 匹配 %{macro_name} 和 %{?macro_name} 形式的宏
+SPEC_MACRO_RE = re.compile(r'%\{(\??\w+)\}')
+# 依赖项中的单个依赖子句，操作符前后必须有空白
+SPEC_REQUIRE_CLAUSE_RE = re.compile(r'(\S+)(?:\s+(>=|<=|!=|~>|>|<|=)\s+(\S+))?')
+# 依赖项中可直接替换的包自身宏
+SPEC_BUILTIN_MACRO_RE = re.compile(r'%\{(name|version|release)\}')
+# 可被 tarfile 透明解压的压缩格式魔数（gzip、bzip2、xz）
+COMPRESSED_TAR_MAGICS = (b'\x1f\x8b', b'BZh', b'\xfd7zXZ\x00')
+# zip 文件魔数
+ZIP_MAGIC = b'PK\x03\x04'
+# POSIX tar 头部中 ustar 标识所在的偏移
+TAR_USTAR_OFFSET = 257
+# 检测包类型时最多遍历的压缩包成员数，防止成员数量异常庞大的压缩包耗尽内存和 CPU
+ARCHIVE_DETECT_MAX_MEMBERS = 100000
+
 
 def process_src_package(pkg_path: str, originators: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]], Dict[str, Any]]:
     """
@@ -45,21 +66,40 @@ def process_src_package(pkg_path: str, originators: Dict[str, Any]) -> Tuple[Dic
         - 第三个元素为字典，更新后的来源者信息。
     """
 
-    md5_value = _calculate_package_md5(pkg_path)
+    md5_value, source_kind, package_type, content = _scan_source_package(pkg_path)
+
+    if package_type == 'rpm':
+        return _process_spec(content, md5_value, originators)
+    if package_type == 'deb':
+        return _process_debian_control(content, md5_value, originators, pkg_path)
+    return _process_generic_source_package(pkg_path, md5_value, originators, source_kind)
+
+
+def _scan_source_package(pkg_path: str) -> Tuple[str, str, str, str]:
+    """
+    计算源码包的 MD5 并检测包类型。
+
+    Args:
+        pkg_path (str): 源码包路径。
+
+    Returns:
+        Tuple[str, str, str, str]: 依次为 MD5 校验和、外层格式标识、源码包类型（'rpm'、'deb' 或 'other'）以及对应文件内容。
+    """
+
     source_kind = _detect_source_package_kind(pkg_path)
+    if source_kind == 'tar':
+        # tar 包在流式检测包类型的同时计算 MD5，只读取一遍文件
+        md5_value, package_type, content = _scan_tar_package(pkg_path)
+        return md5_value, source_kind, package_type, content
 
-    if source_kind == 'src_rpm':
+    md5_value = _calculate_package_md5(pkg_path)
+    if source_kind in ('src_rpm', 'zip'):
         package_type, content = _detect_package_type(pkg_path)
-        if package_type == 'rpm':
-            return _process_spec(content, md5_value, originators)
-        return _process_generic_source_package(pkg_path, md5_value, originators, "src_rpm")
-    if source_kind == 'tar':
-        return _process_tar_source_package(pkg_path, md5_value, originators)
-    if source_kind == 'zip':
-        return _process_zip_source_package(pkg_path, md5_value, originators)
-    if source_kind == 'debian_source':
-        return _process_debian_source_package(pkg_path, md5_value, originators)
-    return _process_generic_source_package(pkg_path, md5_value, originators, "source")
+    elif source_kind == 'debian_source':
+        package_type, content = 'deb', _read_text_file(pkg_path)
+    else:
+        package_type, content = 'other', ''
+    return md5_value, source_kind, package_type, content
 
 
 def _detect_source_package_kind(pkg_path: str) -> str:
@@ -95,11 +135,55 @@ def _calculate_package_md5(file_path: str) -> str:
         str: 文件的MD5校验和，以十六进制字符串形式返回。
     """
 
-    hash_md5 = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+    # 交由 calculate_md5 处理：按路径打开时使用 hashlib.file_digest 的大缓冲区读取，并提示内核顺序预读
+    return calculate_md5(file_path)
+
+
+class _HashingReader(io.RawIOBase):
+    """在读取底层文件的同时更新 MD5 摘要，使包类型检测与校验和计算共用一次读取。"""
+
+    def __init__(self, fileobj: BinaryIO):
+        self._fileobj = fileobj
+        self._md5 = hashlib.md5()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = self._fileobj.readinto(buffer)
+        if size:
+            self._md5.update(memoryview(buffer)[:size])
+        return size
+
+    def hexdigest(self) -> str:
+        """读完剩余内容后返回整个文件的 MD5 校验和。"""
+
+        while self.read(HASH_CHUNK_SIZE):
+            pass
+        return self._md5.hexdigest()
+
+
+def _scan_tar_package(pkg_path: str) -> Tuple[str, str, str]:
+    """
+    以流式方式读取 tar 源码包，在检测包类型的同时计算 MD5 校验和。
+
+    Args:
+        pkg_path (str): tar 源码包的文件路径。
+
+    Returns:
+        Tuple[str, str, str]: 返回一个元组，依次为文件的 MD5 校验和、检测到的源码包类型以及对应文件内容。
+    """
+
+    with open(pkg_path, 'rb') as f:
+        reader = _HashingReader(f)
+        try:
+            with tarfile.open(fileobj=reader, mode='r|*') as tar:
+                package_type, content = _detect_from_archive(tar, current_depth=0)
+        except Exception as e:
+            logging.error(f"处理 tar 格式时出错: {str(e)}")
+            package_type, content = ('other', '')
+        # 检测命中后不再解压剩余成员，只需顺序读完压缩数据以完成摘要
+        return reader.hexdigest(), package_type, content
 
 
 def _detect_package_type(pkg_path: str) -> Tuple[str, str]:
@@ -133,7 +217,7 @@ def _detect_package_type(pkg_path: str) -> Tuple[str, str]:
                     with rpmfile.open(pkg_path) as rpm:
                         return _detect_from_src_rpm(rpm)
                 if ext in ('.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz', '.tar'):
-                    with tarfile.open(pkg_path, 'r:*') as tar:
+                    with tarfile.open(pkg_path, 'r|*') as tar:
                         return _detect_from_archive(tar, current_depth=0)
                 elif ext == '.zip':
                     with zipfile.ZipFile(pkg_path, 'r') as z:
@@ -145,6 +229,26 @@ def _detect_package_type(pkg_path: str) -> Tuple[str, str]:
     return ('other', '')
 
 
+def _sniff_archive_format(data: bytes) -> str:
+    """
+    根据文件头魔数判断嵌套压缩包的实际格式，避免对扩展名不符的文件逐一尝试解压。
+
+    Args:
+        data (bytes): 嵌套压缩包的头部内容，需包含 tar 头部中的 ustar 标识。
+
+    Returns:
+        str: 'zip'、'tar'，无法识别时返回空字符串。
+    """
+
+    if data.startswith(ZIP_MAGIC):
+        return 'zip'
+    if data.startswith(COMPRESSED_TAR_MAGICS):
+        return 'tar'
+    if data[TAR_USTAR_OFFSET:TAR_USTAR_OFFSET + 5] == b'ustar':
+        return 'tar'
+    return ''
+
+
 def _detect_from_src_rpm(rpm: rpmfile.RPMFile) -> Tuple[str, str]:
     """
     从 RPM 源码包中检测 spec 文件并返回其内容。
@@ -180,8 +284,8 @@ def _detect_from_archive(tar: tarfile.TarFile, current_depth: int) -> Tuple[str,
     """
 
     return _detect_from_members(
-        members=tar.getmembers(),
-        extract_file=lambda m: tar.extractfile(m).read(),
+        members=tar,
+        open_member=tar.extractfile,
         current_depth=current_depth
     )
 
@@ -201,16 +305,16 @@ def _detect_from_zip(zipf: zipfile.ZipFile, current_depth: int) -> Tuple[str, st
     """
 
     return _detect_from_members(
-        members=zipf.namelist(),
-        extract_file=lambda m: zipf.open(m).read(),
+        members=zipf.infolist(),
+        open_member=zipf.open,
         current_depth=current_depth,
         is_zip=True
     )
 
 
 def _detect_from_members(
-    members: List[Any],
-    extract_file: Callable[[Any], bytes],
+    members: Iterable[Any],
+    open_member: Callable[[Any], BinaryIO],
     current_depth: int,
     is_zip: bool = False
 ) -> Tuple[str, str]:
@@ -218,8 +322,8 @@ def _detect_from_members(
     从压缩文件成员中检测源码包类型并返回类型和对应文件内容。
 
     Args:
-        members (list): 压缩文件中的成员列表。
-        extract_file (Callable): 用于提取文件内容的函数。
+        members (iterable): 压缩文件中的成员，只遍历一次。
+        open_member (Callable): 用于打开成员并返回可读文件对象的函数。
         current_depth (int): 当前递归深度，用于控制递归检测的深度。
         is_zip (bool, optional): 布尔值，指示当前处理的是否为 zip 压缩文件。默认为 `False`，表示处理 tar 压缩文件。
 
@@ -233,70 +337,84 @@ def _detect_from_members(
     if current_depth > MAX_DEPTH:
         return ('other', '')
 
-    # 优先检测spec文件
-    for member in members:
-        member_name = member.name if not is_zip else member
+    # 单次遍历成员：spec 文件优先级最高，命中即返回；control 文件和嵌套压缩包在遍历到时立即处理，
+    # 以支持只能顺序访问的流式 tar，检测结果留待遍历结束后按优先级使用
+    control_content = None
+    nested_result = None
+    for index, member in enumerate(members):
+        if index >= ARCHIVE_DETECT_MAX_MEMBERS:
+            logging.warning(f"压缩包成员数超过 {ARCHIVE_DETECT_MAX_MEMBERS}，停止检测剩余成员")
+            break
+        member_name = member.name if not is_zip else member.filename
         if member_name.endswith('.spec'):
             try:
-                content = extract_file(member).decode('utf-8', errors='ignore')
+                content = open_member(member).read().decode('utf-8', errors='ignore')
                 return ('rpm', content)
             except Exception:
                 continue
-
-    # 然后检测control文件
-    for member in members:
-        member_name = member.name if not is_zip else member
-        if 'debian/control' in member_name:
+        if control_content is None and 'debian/control' in member_name:
             try:
-                content = extract_file(member).decode('utf-8', errors='ignore')
-                return ('deb', content)
+                control_content = open_member(member).read().decode('utf-8', errors='ignore')
             except Exception:
-                continue
-
-    # 最后检测嵌套压缩包
-    for member in members:
-        member_name = member.name if not is_zip else member
-        lower_name = member_name.lower()
-        if lower_name.endswith(('.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz', '.tar', '.zip')):
+                pass
+        if (control_content is None and nested_result is None
+                and member_name.lower().endswith(('.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz', '.tar', '.zip'))):
             try:
-                data = extract_file(member)
-                if lower_name.endswith('.zip'):
-                    with zipfile.ZipFile(io.BytesIO(data)) as nested_zip:
-                        return _detect_from_zip(nested_zip, current_depth+1)
-                with tarfile.open(fileobj=io.BytesIO(data), mode='r:*') as nested_tar:
-                    return _detect_from_archive(nested_tar, current_depth+1)
+                nested_result = _detect_from_nested_archive(open_member(member), current_depth+1)
             except Exception:
                 continue
 
+    # 然后使用control文件
+    if control_content is not None:
+        return ('deb', control_content)
+
+    # 最后使用第一个可识别的嵌套压缩包的检测结果
+    if nested_result is not None:
+        return nested_result
+
     return ('other', '')
 
 
+def _detect_from_nested_archive(stream: BinaryIO, current_depth: int) -> Optional[Tuple[str, str]]:
+    """
+    检测嵌套压缩包的源码包类型。tar 包直接在成员流上以流式模式读取，不将整个嵌套包读入内存；
+    zip 包需要随机访问，仍读入内存后打开。
+
+    Args:
+        stream (BinaryIO): 嵌套压缩包成员的文件对象，需支持 `peek`。
+        current_depth (int): 嵌套压缩包所在的递归深度。
+
+    Returns:
+        Optional[Tuple[str, str]]: 检测结果；成员不是可识别的压缩包时返回 None。
+    """
+
+    archive_format = _sniff_archive_format(stream.peek(TAR_USTAR_OFFSET + 5))
+    if archive_format == 'zip':
+        with zipfile.ZipFile(io.BytesIO(stream.read())) as nested_zip:
+            return _detect_from_zip(nested_zip, current_depth)
+    if archive_format == 'tar':
+        with tarfile.open(fileobj=stream, mode='r|*') as nested_tar:
+            return _detect_from_archive(nested_tar, current_depth)
+    return None
+
+
 def _process_spec(
     spec_content: str,
     md5_value: str,
     originators: Dict[str, Any]
 ):
     def _process_requires(requires: List[str]) -> List[str]:
-        operators = {'>=', '<=', '>', '<', '=', '!=', '~>'}  # 定义可能的操作符集合
+        builtin_macros = {'name': name, 'version': version, 'release': release}
         processed_requires = []
 
         for require in requires:
-            tokens = require.split()
-            i = 0
-            while i < len(tokens):
-                if i + 1 < len(tokens) and tokens[i+1] in operators:
-                    if i + 2 < len(tokens):
-                        req = f"{tokens[i]} {tokens[i+1]} {tokens[i+2]}"
-                        i += 3
-                    else:
-                        req = tokens[i]
-                        i += 1
-                else:
-                    req = tokens[i]
-                    i += 1
-                processed_req = req.replace('%{name}', name).replace(
-                    '%{version}', version).replace('%{release}', release)
-                processed_requires.append(processed_req)
+            # 每个依赖子句为 "包名" 或 "包名 操作符 版本"
+            for match in SPEC_REQUIRE_CLAUSE_RE.finditer(require):
+                dep_name, operator, dep_version = match.groups()
+                req = f"{dep_name} {operator} {dep_version}" if operator else dep_name
+                if '%' in req:
+                    req = SPEC_BUILTIN_MACRO_RE.sub(lambda macro: builtin_macros[macro.group(1)], req)
+                processed_requires.append(req)
         return processed_requires
 
     # 解析spec文件内容
@@ -361,11 +479,8 @@ def _parse_spec_content(spec_content: str) -> Dict[str, Any]:
     macros = {}
     current_section = None
     description_lines = []
-    in_preamble = True
-
-    lines = spec_content.split('\n')
 
-    for line in lines:
+    for line in io.StringIO(spec_content):
         stripped_line = line.rstrip()
 
         if stripped_line.startswith('%define') or stripped_line.startswith('%global'):
@@ -379,46 +494,26 @@ def _parse_spec_content(spec_content: str) -> Dict[str, Any]:
                 macros[macro_name] = macro_value
             continue
 
-        if stripped_line.startswith('%package') and in_preamble:
-            in_preamble = False
+        if stripped_line.startswith('%package'):
+            # 主包前导区到此结束，之后的子包内容不再需要解析
+            break
 
         if stripped_line.startswith('%'):
             current_section = stripped_line.split()[0].lower()
             continue
 
-        if in_preamble:
-            if stripped_line.lower().startswith('name:'):
-                name = stripped_line.split(':', 1)[1].strip()
-                parsed['name'] = _replace_macros(name, macros)
-            elif stripped_line.lower().startswith('version:'):
-                version = stripped_line.split(':', 1)[1].strip()
-                parsed['version'] = _replace_macros(version, macros)
-            elif stripped_line.lower().startswith('release:'):
-                release = stripped_line.split(':', 1)[1].strip()
-                parsed['release'] = _replace_macros(release, macros)
-            elif stripped_line.lower().startswith('license:'):
-                license = stripped_line.split(':', 1)[1].strip()
-                parsed['license'] = _replace_macros(license, macros)
-            elif stripped_line.lower().startswith('url:'):
-                url = stripped_line.split(':', 1)[1].strip()
-                parsed['url'] = _replace_macros(url, macros)
-            elif stripped_line.lower().startswith('buildrequires:'):
-                buildrequires = [r.strip() for r in stripped_line.split(
-                    ':', 1)[1].split(',') if r.strip()]
-                buildrequires = [_replace_macros(
-                    r, macros) for r in buildrequires]
-                parsed.setdefault('buildrequires', []).extend(buildrequires)
-            elif stripped_line.lower().startswith('requires:'):
-                requires = [r.strip() for r in stripped_line.split(
-                    ':', 1)[1].split(',') if r.strip()]
-                requires = [_replace_macros(r, macros) for r in requires]
-                parsed.setdefault('requires', []).extend(requires)
-            elif stripped_line.lower().startswith('buildarch:'):
-                arch = stripped_line.split(':', 1)[1].strip()
-                parsed['architecture'] = _replace_macros(arch, macros)
-
-            if current_section == '%description':
-                description_lines.append(stripped_line)
+        tag_match = SPEC_TAG_RE.match(stripped_line)
+        if tag_match:
+            tag = tag_match.group(1).lower()
+            value = stripped_line[tag_match.end():]
+            if tag in ('buildrequires', 'requires'):
+                values = [_replace_macros(r.strip(), macros) for r in value.split(',') if r.strip()]
+                parsed.setdefault(tag, []).extend(values)
+            else:
+                parsed[SPEC_TAG_KEYS.get(tag, tag)] = _replace_macros(value.strip(), macros)
+
+        if current_section == '%description':
+            description_lines.append(stripped_line)
 
     if description_lines:
         parsed['description'] = ' '.join(
@@ -449,44 +544,9 @@ def _replace_macros(value: str, macros: Dict[str, str]) -> str:
         else:
             return macros.get(macro_name, match.group(0))
 
-    # 匹配 %{macro_name} 和 %{?macro_name} 形式的宏
-    pattern = r'%\{(\??\w+)\}'
-    return re.sub(pattern, replace, value)
-
-
-def _process_tar_source_package(
-    pkg_path: str,
-    md5_value: str,
-    originators: Dict[str, Any]
-) -> Tuple[Package, List[Dict[str, Any]], Dict[str, Any]]:
-    package_type, content = _detect_package_type(pkg_path)
-    if package_type == 'rpm':
-        return _process_spec(content, md5_value, originators)
-    if package_type == 'deb':
-        return _process_debian_control(content, md5_value, originators, pkg_path)
-    return _process_generic_source_package(pkg_path, md5_value, originators, "tar")
-
-
-def _process_zip_source_package(
-    pkg_path: str,
-    md5_value: str,
-    originators: Dict[str, Any]
-) -> Tuple[Package, List[Dict[str, Any]], Dict[str, Any]]:
-    package_type, content = _detect_package_type(pkg_path)
-    if package_type == 'rpm':
-        return _process_spec(content, md5_value, originators)
-    if package_type == 'deb':
-        return _process_debian_control(content, md5_value, originators, pkg_path)
-    return _process_generic_source_package(pkg_path, md5_value, originators, "zip")
-
-
-def _process_debian_source_package(
-    pkg_path: str,
-    md5_value: str,
-    originators: Dict[str, Any]
-) -> Tuple[Package, List[Dict[str, Any]], Dict[str, Any]]:
-    fields = _parse_debian_control_fields(_read_text_file(pkg_path))
-    return _build_debian_source_package(fields, md5_value, originators, pkg_path)
+    if '%' not in value:
+        return value
+    return SPEC_MACRO_RE.sub(replace, value)
 
 
 def _process_debian_control(
@@ -14,8 +14,9 @@
 
 from actions import ASSIST_DIR
 from actions.data_helper import read_data_from_json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 import os
+import re
 
 
 suppliers_file_path = os.path.join(ASSIST_DIR, 'suppliers.json')
@@ -25,6 +26,15 @@ RPM_SUPPLIERS = [
 DEB_SUPPLIERS = [
     supplier for supplier in supplier_list if supplier.get('type') == 'deb']
 
+# 直接供应商匹配结果缓存：以供应商列表对象的 id 为键，值依次为列表引用（防止 id 被复用）、
+# 由全部关键词编译的正则、关键词到供应商序号的映射以及按字符串缓存的匹配结果
+_SUPPLIER_MATCHES: Dict[int, Tuple[
+    List[Dict[str, Any]],
+    Optional[Pattern[str]],
+    Dict[str, int],
+    Dict[str, Tuple[str, Optional[str]]]
+]] = {}
+
 
 def get_suppliers(
     direct_supplier: str,
@@ -45,35 +55,81 @@ def get_suppliers(
         list: 供应商信息列表。
     """
 
-    # 初始化供应商列表
+    # 按层级依次添加直接供应商和上游来源，层级从 1 开始递增
     suppliers = []
-    current_tier = 0
-
-    def _contains_keyword(string: str, keywords: List[str]) -> bool:
-        """检查字符串是否包含任意一个关键词。"""
-        return any(keyword in string for keyword in keywords)
-
-    def _add_supplier(name: str, link: Optional[str], tier_increment: int = 1) -> None:
-        """添加供应商信息到列表中。"""
-        nonlocal current_tier
-        current_tier += tier_increment
-        suppliers.append({
-            "name": name,
-            "tier": current_tier,
-            "link": link
-        })
-
-    supplier_name = direct_supplier
-    supplier_link = None
-    for supplier in supplier_dicts:
-        if _contains_keyword(direct_supplier, supplier.get('keywords')):
-            supplier_name = supplier.get('name')
-            supplier_link = supplier.get('url')
-            break
+    supplier_name, supplier_link = _match_direct_supplier(direct_supplier, supplier_dicts)
     if supplier_link:
-        _add_supplier(supplier_name, supplier_link)
+        suppliers.append({"name": supplier_name, "tier": len(suppliers) + 1, "link": supplier_link})
     if homepage:
-        _add_supplier(originator_name, homepage)
+        suppliers.append({"name": originator_name, "tier": len(suppliers) + 1, "link": homepage})
 
     # 返回供应商列表和软件包类型
     return suppliers
+
+
+def _match_direct_supplier(
+    direct_supplier: str,
+    supplier_dicts: List[Dict[str, Any]]
+) -> Tuple[str, Optional[str]]:
+    """
+    根据关键词匹配直接供应商。同一发行版中的软件包大量共用相同的 release 字符串，匹配结果按列表和字符串缓存。
+
+    Args:
+        direct_supplier (str): 直接供应商名称。
+        supplier_dicts (list): 供应商字典列表。
+
+    Returns:
+        tuple: 供应商名称和链接。未匹配到时返回原名称和 None。
+    """
+
+    if not direct_supplier:
+        return direct_supplier, None
+
+    entry = _SUPPLIER_MATCHES.get(id(supplier_dicts))
+    if entry is None or entry[0] is not supplier_dicts:
+        entry = (supplier_dicts, *_compile_supplier_keywords(supplier_dicts), {})
+        _SUPPLIER_MATCHES[id(supplier_dicts)] = entry
+
+    _, keyword_re, keyword_index, matches = entry
+    match = matches.get(direct_supplier)
+    if match is None:
+        match = (direct_supplier, None)
+        if keyword_re is not None:
+            # 一次扫描找出字符串中出现的全部关键词，多个供应商同时命中时仍以列表中靠前者为准
+            indexes = [keyword_index[m.group(1)] for m in keyword_re.finditer(direct_supplier)]
+            if indexes:
+                supplier = supplier_dicts[min(indexes)]
+                match = (supplier.get('name'), supplier.get('url'))
+        matches[direct_supplier] = match
+    return match
+
+
+def _compile_supplier_keywords(
+    supplier_dicts: List[Dict[str, Any]]
+) -> Tuple[Optional[Pattern[str]], Dict[str, int]]:
+    """
+    将供应商列表中的全部关键词编译为一个多选正则。
+
+    Args:
+        supplier_dicts (list): 供应商字典列表。
+
+    Returns:
+        tuple: 编译后的正则（无关键词时为 None）和关键词到供应商序号的映射。
+    """
+
+    first_index = {}
+    for index, supplier in enumerate(supplier_dicts):
+        for keyword in supplier.get('keywords') or ():
+            first_index.setdefault(keyword, index)
+    if not first_index:
+        return None, first_index
+
+    # 命中某个关键词时，作为其子串的关键词也必然出现，因此映射到这些关键词中最靠前的供应商
+    keyword_index = {
+        keyword: min(index for other, index in first_index.items() if other in keyword)
+        for keyword in first_index
+    }
+    # 以零宽先行断言在每个位置上匹配，长关键词优先，保证重叠出现的关键词不被遗漏
+    keywords = sorted(first_index, key=len, reverse=True)
+    pattern = '(?=(' + '|'.join(re.escape(keyword) for keyword in keywords) + '))'
+    return re.compile(pattern), keyword_index
@@ -20,6 +20,8 @@ import time
 import logging
 import argparse
 import csv
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from actions import (
     LOG_DIR
 )
@@ -52,6 +54,16 @@ from actions.scanner.gbt_sbom_helper import (
     sign_gbt_sbom
 )
 
+# 保存 SBOM 时并行写入文件的线程数，对应 Linx 格式的五个部分
+SBOM_WRITE_WORKERS = 5
+# 软件包后缀与包类型的对应表，按匹配优先级排列，.src.rpm 必须先于 .rpm 匹配
+PACKAGE_TYPE_SUFFIXES = (
+    (('.src.rpm', '.dsc') + SOURCE_ARCHIVE_SUFFIXES, "source", "侦测到源码包"),
+    (('.deb',), "deb", "侦测到DEB包"),
+    (('.rpm',), "rpm", "侦测到RPM包"),
+)
+
+
 def parse_arguments():
     """
     解析命令行参数，用于配置扫描源代码包以获取版权和许可证信息的工具。
@@ -100,24 +112,28 @@ def setup_logging(formatted_utc_time):
     # 创建日志目录
     os.makedirs(LOG_DIR, exist_ok=True)
 
-    # 获取所有日志文件
-    log_files = [f for f in os.listdir(
-        LOG_DIR) if f.startswith('log_') and f.endswith('.log')]
-
-    # 按创建时间排序（旧文件在前）
-    log_files.sort(key=lambda x: os.path.getctime(os.path.join(LOG_DIR, x)))
+    # 单次遍历日志目录，只在小顶堆中保留最新的 max_log_files - 1 个日志，
+    # 被挤出堆的日志一定不在保留范围内，无需保存全部日志文件再排序
+    max_log_files = 200
+    newest_log_files = []
+    files_to_delete = []
+    with os.scandir(LOG_DIR) as entries:
+        for entry in entries:
+            if not (entry.name.startswith('log_') and entry.name.endswith('.log')):
+                continue
+            log_entry = (entry.stat().st_ctime, entry.path)
+            if len(newest_log_files) < max_log_files - 1:
+                heapq.heappush(newest_log_files, log_entry)
+            else:
+                files_to_delete.append(heapq.heappushpop(newest_log_files, log_entry)[1])
 
     # 删除超出的旧日志文件
-    max_log_files = 200
-    if len(log_files) + 1 > max_log_files:
-        files_to_delete = len(log_files) + 1 - max_log_files
-        for i in range(files_to_delete):
-            file_to_delete = os.path.join(LOG_DIR, log_files[i])
-            try:
-                os.remove(file_to_delete)
-                logging.debug(f"删除日志: {file_to_delete}")
-            except Exception as e:
-                logging.error(f"删除 {file_to_delete} 时失败: {str(e)}")
+    for file_to_delete in files_to_delete:
+        try:
+            os.remove(file_to_delete)
+            logging.debug(f"删除日志: {file_to_delete}")
+        except Exception as e:
+            logging.error(f"删除 {file_to_delete} 时失败: {str(e)}")
 
     # 创建新日志文件
     log_file = os.path.join(LOG_DIR, f'log_{formatted_utc_time}.log')
@@ -222,6 +238,24 @@ def _is_source_archive_request(args):
     return package_path.lower().endswith(SOURCE_ARCHIVE_SUFFIXES)
 
 
+def detect_package_type(package_path):
+    """根据文件后缀判断软件包类型。
+
+    Args:
+        package_path (str): 软件包路径。
+
+    Returns:
+        str | None: 包类型（source、deb 或 rpm），无法识别时返回 None。
+    """
+
+    lower_package_path = package_path.lower()
+    for suffixes, package_type, message in PACKAGE_TYPE_SUFFIXES:
+        if lower_package_path.endswith(suffixes):
+            logging.info(message)
+            return package_type
+    return None
+
+
 def save_sbom(
         linx_sbom, package_type, filename, utc_timestamp, spdx_timestamp,
         output_dir, output_formats, ecosystem=None, config=None, scan_mode=None,
@@ -246,37 +280,43 @@ def save_sbom(
         None: 函数不返回任何内容。
     """
 
+    # 各格式的输出目录在写入前按需创建，makedirs 会一并创建上级目录
     sbom_path = os.path.join(output_dir, filename)
-    os.makedirs(sbom_path, exist_ok=True)
-
-    if "linx" in output_formats:
-        linx_sbom_dirname = f"linx-sbom_{filename}_{utc_timestamp}"
-        linx_sbom_packages_filename = f"packages_{filename}_{utc_timestamp}.json"
-        linx_sbom_files_filename = f"files_{filename}_{utc_timestamp}.json"
-        linx_sbom_licenses_filename = f"licenses_{filename}_{utc_timestamp}.json"
-        linx_sbom_package_relationships_filename = f"package_relationships_{filename}_{utc_timestamp}.json"
-        linx_sbom_file_relationships_filename = f"file_relationships_{filename}_{utc_timestamp}.json"
-        linx_sbom_path = os.path.join(sbom_path, linx_sbom_dirname)
-        os.makedirs(linx_sbom_path, exist_ok=True)
-
-        save_data_to_json(linx_sbom.get('packages_sbom'),
-                          os.path.join(linx_sbom_path, linx_sbom_packages_filename))
-        save_data_to_json(linx_sbom.get('files_sbom'),
-                          os.path.join(linx_sbom_path, linx_sbom_files_filename))
-        save_data_to_json(linx_sbom.get('licenses_sbom'),
-                          os.path.join(linx_sbom_path, linx_sbom_licenses_filename))
-        save_data_to_json(linx_sbom.get('package_relationships_sbom'),
-                          os.path.join(linx_sbom_path, linx_sbom_package_relationships_filename))
-        save_data_to_json(linx_sbom.get('file_relationships_sbom'),
-                          os.path.join(linx_sbom_path, linx_sbom_file_relationships_filename))
-        logging.info(f"{linx_sbom_dirname} 已被保存至 {output_dir}")
-
-    if "spdx" in output_formats:
-        spdx_sbom = convert_to_spdx(
-            linx_sbom, filename, spdx_timestamp, package_type)
-        spdx_sbom_filename = f"spdx-sbom_{filename}_{utc_timestamp}.json"
-        save_data_to_json(spdx_sbom, os.path.join(sbom_path, spdx_sbom_filename))
-        logging.info(f"{spdx_sbom_filename} 已被保存至 {output_dir}")
+
+    # Linx 各部分互不依赖，提交到线程池并行写入；SPDX 转换只读取内存中的数据，在主线程中与这些写入重叠进行
+    with ThreadPoolExecutor(max_workers=SBOM_WRITE_WORKERS) as executor:
+        linx_writes = []
+        if "linx" in output_formats:
+            linx_sbom_dirname = f"linx-sbom_{filename}_{utc_timestamp}"
+            linx_sbom_path = os.path.join(sbom_path, linx_sbom_dirname)
+            os.makedirs(linx_sbom_path, exist_ok=True)
+
+            linx_sbom_suffix = f"{filename}_{utc_timestamp}.json"
+            linx_sbom_sections = (
+                ('packages_sbom', f"packages_{linx_sbom_suffix}"),
+                ('files_sbom', f"files_{linx_sbom_suffix}"),
+                ('licenses_sbom', f"licenses_{linx_sbom_suffix}"),
+                ('package_relationships_sbom', f"package_relationships_{linx_sbom_suffix}"),
+                ('file_relationships_sbom', f"file_relationships_{linx_sbom_suffix}"),
+            )
+            linx_writes = [
+                executor.submit(save_data_to_json, linx_sbom.get(key), os.path.join(linx_sbom_path, name))
+                for key, name in linx_sbom_sections
+            ]
+
+        if "spdx" in output_formats:
+            spdx_sbom = convert_to_spdx(
+                linx_sbom, filename, spdx_timestamp, package_type)
+            spdx_sbom_filename = f"spdx-sbom_{filename}_{utc_timestamp}.json"
+            os.makedirs(sbom_path, exist_ok=True)
+            save_data_to_json(spdx_sbom, os.path.join(sbom_path, spdx_sbom_filename))
+            logging.info(f"{spdx_sbom_filename} 已被保存至 {output_dir}")
+
+        # 等待 Linx 各部分写入完成，写入过程中的异常在此抛出
+        for future in linx_writes:
+            future.result()
+        if linx_writes:
+            logging.info(f"{linx_sbom_dirname} 已被保存至 {output_dir}")
 
     if "gbt" in output_formats:
         gbt_sbom_dirname = f"gbt-sbom_{filename}_{utc_timestamp}"
@@ -308,6 +348,128 @@ def resolve_output_formats(formats):
     return list(dict.fromkeys(formats))
 
 
+def _scan_iso_request(iso_path, spdx_utc_time, runtime_options):
+    """
+    扫描ISO镜像。
+
+    Args:
+        iso_path (str): ISO镜像文件路径。
+        spdx_utc_time (str): SPDX 格式的UTC时间字符串。
+        runtime_options (dict): 运行时配置项。
+
+    Returns:
+        tuple: Linx SBOM、包类型、输出文件名和扫描源路径。
+    """
+
+    filename = os.path.splitext(os.path.basename(iso_path))[0]
+    try:
+        linx_sbom, package_type = scan_iso(
+            iso_path, filename, spdx_utc_time,
+            runtime_options["disable_tqdm"],
+            runtime_options["max_workers"])
+    except Exception as e:
+        logging.error(f"异常抛出: {e}")
+        sys.exit(1)
+    return linx_sbom, package_type, filename, iso_path
+
+
+def _scan_package_request(package_path, spdx_utc_time, runtime_options):
+    """
+    扫描单个软件包。
+
+    Args:
+        package_path (str): 软件包路径。
+        spdx_utc_time (str): SPDX 格式的UTC时间字符串。
+        runtime_options (dict): 运行时配置项。
+
+    Returns:
+        tuple: Linx SBOM、包类型、输出文件名和扫描源路径。
+    """
+
+    filename = os.path.splitext(os.path.basename(package_path))[0]
+    package_type = detect_package_type(package_path)
+    if package_type is None:
+        logging.error("未侦测到有效的包")
+        sys.exit(1)
+
+    linx_sbom = package_scanner(
+        package_path, package_type, spdx_utc_time,
+        runtime_options["include"],
+        runtime_options["exclude"],
+        runtime_options["max_workers"],
+        runtime_options["disable_tqdm"],
+        runtime_options["brief"])
+    return linx_sbom, package_type, filename, package_path
+
+
+def _scan_repo_request(repo, spdx_utc_time, runtime_options):
+    """
+    扫描更新源。
+
+    Args:
+        repo (str): 更新源地址。
+        spdx_utc_time (str): SPDX 格式的UTC时间字符串。
+        runtime_options (dict): 运行时配置项。
+
+    Returns:
+        tuple: Linx SBOM、包类型、输出文件名和扫描源路径（更新源无本地路径，为 None）。
+    """
+
+    # 查找 primary.xml.gz 文件
+    repo_url = repo.rstrip('/') + '/'
+    primary_xml_url = find_primary_xml_in_repo(repo_url)
+    sources_file_url = find_deb_sources_in_repo(repo_url)
+    if not primary_xml_url and not sources_file_url:
+        logging.error(f"未侦测到有效的更新源地址")
+        sys.exit(1)
+    try:
+        if primary_xml_url:
+            linx_sbom = rpm_repo_scanner(
+                primary_xml_url, repo_url, spdx_utc_time,
+                runtime_options["disable_tqdm"])
+        else:
+            linx_sbom = deb_repo_scanner(
+                sources_file_url, repo_url, spdx_utc_time,
+                runtime_options["disable_tqdm"])
+    except Exception as e:
+        logging.error(f"异常抛出: {e}")
+        sys.exit(1)
+    return linx_sbom, "repo", "repo", None
+
+
+def _scan_docker_request(image, spdx_utc_time, runtime_options):
+    """
+    扫描 Docker 镜像。
+
+    Args:
+        image (str): Docker Hub 镜像名或离线 Docker 镜像 tar 文件路径。
+        spdx_utc_time (str): SPDX 格式的UTC时间字符串。
+        runtime_options (dict): 运行时配置项。
+
+    Returns:
+        tuple: Linx SBOM、包类型、输出文件名和扫描源路径。
+    """
+
+    try:
+        linx_sbom, package_type, filename = scan_docker_image(
+            image, spdx_utc_time,
+            runtime_options["platform"],
+            runtime_options["disable_tqdm"])
+    except Exception as e:
+        logging.error(f"异常抛出: {e}")
+        sys.exit(1)
+    return linx_sbom, package_type, filename, image
+
+
+# 扫描模式与处理函数的对应表，模式名与互斥命令行参数同名
+SCAN_HANDLERS = (
+    ("iso", _scan_iso_request),
+    ("package", _scan_package_request),
+    ("repo", _scan_repo_request),
+    ("docker", _scan_docker_request),
+)
+
+
 def main():
     """
     主函数，负责解析命令行参数、设置日志记录系统、处理ISO镜像或软件包，并生成SBOM。
@@ -335,93 +497,17 @@ def main():
     output_formats = resolve_output_formats(args.format)
     validate_output_request(args, output_formats)
 
-    # 配置输出目录
-    output_dir = args.output
-    scan_mode = None
-    source_path = None
-
-    # 处理ISO镜像
-    if args.iso is not None:
-        scan_mode = "iso"
-        source_path = args.iso
-        filename = os.path.splitext(os.path.basename(args.iso))[0]
-        try:
-            linx_sbom, package_type = scan_iso(
-                args.iso, filename, spdx_utc_time,
-                runtime_options["disable_tqdm"],
-                runtime_options["max_workers"])
-        except Exception as e:
-            logging.error(f"异常抛出: {e}")
-            sys.exit(1)
-
-    # 处理软件包
-    elif args.package is not None:
-        scan_mode = "package"
-        package_path = args.package
-        source_path = package_path
-        filename = os.path.splitext(os.path.basename(package_path))[0]
-        lower_package_path = package_path.lower()
-
-        package_type = "unknown"
-        if lower_package_path.endswith(('.src.rpm', '.dsc') + SOURCE_ARCHIVE_SUFFIXES):
-            package_type = "source"
-            logging.info("侦测到源码包")
-        elif lower_package_path.endswith('.deb'):
-            package_type = "deb"
-            logging.info("侦测到DEB包")
-        elif lower_package_path.endswith('.rpm'):
-            package_type = "rpm"
-            logging.info("侦测到RPM包")
-        else:
-            logging.error("未侦测到有效的包")
-            sys.exit(1)
-
-        linx_sbom = package_scanner(
-            package_path, package_type, spdx_utc_time,
-            runtime_options["include"],
-            runtime_options["exclude"],
-            runtime_options["max_workers"],
-            runtime_options["disable_tqdm"],
-            runtime_options["brief"])
-
-    # 处理更新源
-    elif args.repo is not None:
-        scan_mode = "repo"
-        filename = "repo"
-        package_type = "repo"
-
-        # 查找 primary.xml.gz 文件
-        repo_url = args.repo.rstrip('/') + '/'
-        primary_xml_url = find_primary_xml_in_repo(repo_url)
-        sources_file_url = find_deb_sources_in_repo(repo_url)
-        if primary_xml_url:
-            linx_sbom = rpm_repo_scanner(
-                primary_xml_url, repo_url, spdx_utc_time,
-                runtime_options["disable_tqdm"])
-        elif sources_file_url:
-            linx_sbom = deb_repo_scanner(
-                sources_file_url, repo_url, spdx_utc_time,
-                runtime_options["disable_tqdm"])
-        else:
-            logging.error(f"未侦测到有效的更新源地址")
-            sys.exit(1)
-
-    # 处理 Docker 镜像
-    elif args.docker is not None:
-        scan_mode = "docker"
-        source_path = args.docker
-        try:
-            linx_sbom, package_type, filename = scan_docker_image(
-                args.docker, spdx_utc_time,
-                runtime_options["platform"],
-                runtime_options["disable_tqdm"])
-        except Exception as e:
-            logging.error(f"异常抛出: {e}")
-            sys.exit(1)
+    # 按互斥参数选择扫描处理函数
+    for scan_mode, handler in SCAN_HANDLERS:
+        target = getattr(args, scan_mode)
+        if target is not None:
+            linx_sbom, package_type, filename, source_path = handler(
+                target, spdx_utc_time, runtime_options)
+            break
 
     # 保存SBOM
     save_sbom(linx_sbom, package_type, filename,
-              formatted_utc_time, spdx_utc_time, output_dir,
+              formatted_utc_time, spdx_utc_time, args.output,
               output_formats, args.ecosystem, config, scan_mode, source_path)
     logging.info("Linx SBOM 生成完成")
 
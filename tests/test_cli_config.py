@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest import mock
 
 from actions import config_helper
+from actions.scanner import repo_helper
 
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -323,6 +324,42 @@ class OutputFormatTests(unittest.TestCase):
         with self.assertRaises(SystemExit):
             self.cli.validate_output_request(args, ["gbt"])
 
+    def test_detect_package_type_prefers_source_suffixes(self):
+        cases = {
+            "demo-1.0-1.src.rpm": "source",
+            "demo.DSC": "source",
+            "demo.tar.xz": "source",
+            "demo_1.0_amd64.deb": "deb",
+            "demo-1.0-1.x86_64.RPM": "rpm",
+            "demo.iso": None,
+        }
+
+        for package_path, expected in cases.items():
+            with self.subTest(package_path=package_path):
+                self.assertEqual(
+                    self.cli.detect_package_type(package_path), expected)
+
+    def test_setup_logging_keeps_at_most_200_log_files(self):
+        root_logger = self.cli.logging.getLogger()
+        original_handlers = list(root_logger.handlers)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for index in range(205):
+                Path(tmpdir, f"log_{index:05d}.log").touch()
+            Path(tmpdir, "other.txt").touch()
+
+            try:
+                with mock.patch.object(self.cli, "LOG_DIR", tmpdir):
+                    self.cli.setup_logging("20240101000000")
+            finally:
+                for handler in root_logger.handlers[len(original_handlers):]:
+                    handler.close()
+                root_logger.handlers[:] = original_handlers
+
+            log_files = list(Path(tmpdir).glob("log_*.log"))
+            self.assertEqual(len(log_files), 200)
+            self.assertTrue(Path(tmpdir, "log_20240101000000.log").exists())
+            self.assertTrue(Path(tmpdir, "other.txt").exists())
+
     def test_main_passes_config_platform_to_docker_scanner(self):
         config = {
             "scan": {
@@ -350,6 +387,43 @@ class OutputFormatTests(unittest.TestCase):
         scanner.assert_called_once_with(
             "debian:bookworm-slim", mock.ANY, "linux/arm64", True)
 
+    def test_main_exits_when_repo_metadata_stream_fails(self):
+        with mock.patch("sys.argv", [
+                "linx-xiling.py", "-r", "https://example.test/repo", "-o", "out",
+                "--format", "linx"]), \
+                mock.patch.object(self.cli, "setup_logging"), \
+                mock.patch.object(
+                    self.cli, "find_primary_xml_in_repo",
+                    return_value="https://example.test/repo/repodata/primary.xml.gz"), \
+                mock.patch.object(self.cli, "find_deb_sources_in_repo", return_value=None), \
+                mock.patch.object(repo_helper, "read_data_from_json", return_value=[]), \
+                mock.patch.object(repo_helper, "save_data_to_json") as save_json, \
+                mock.patch.object(
+                    repo_helper, "_open_metadata_stream",
+                    side_effect=repo_helper.requests.exceptions.ConnectionError("reset")), \
+                mock.patch.object(self.cli, "save_sbom") as save_sbom:
+            with self.assertRaises(SystemExit) as raised:
+                self.cli.main()
+
+        self.assertEqual(raised.exception.code, 1)
+        save_json.assert_not_called()
+        save_sbom.assert_not_called()
+
+    def test_main_dispatches_iso_scan_and_passes_source_path(self):
+        with mock.patch("sys.argv", [
+                "linx-xiling.py", "-i", "/tmp/demo-1.0.iso", "-o", "out",
+                "--format", "linx"]), \
+                mock.patch.object(self.cli, "setup_logging"), \
+                mock.patch.object(
+                    self.cli, "scan_iso", return_value=({}, "rpm")) as scanner, \
+                mock.patch.object(self.cli, "save_sbom") as save_sbom:
+            self.cli.main()
+
+        self.assertEqual(scanner.call_args.args[:2], ("/tmp/demo-1.0.iso", "demo-1.0"))
+        self.assertEqual(save_sbom.call_args.args[1:3], ("rpm", "demo-1.0"))
+        self.assertEqual(save_sbom.call_args.args[5], "out")
+        self.assertEqual(save_sbom.call_args.args[9:], ("iso", "/tmp/demo-1.0.iso"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,12 +3,15 @@ import gc
 import gzip
 import hashlib
 import json
+import shutil
 import subprocess
 import tarfile
 import tempfile
 import unittest
 import warnings
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.pool import ThreadPool
 from io import BytesIO
 from pathlib import Path
 from unittest import mock
@@ -16,17 +19,26 @@ from unittest import mock
 warnings.simplefilter("ignore", ResourceWarning)
 warnings.simplefilter("ignore", DeprecationWarning)
 
+import pycdlib
 import zstandard
 
-from actions import config_helper
-from actions.data_helper import calculate_md5, calculate_sha1, remove_duplicates
-from actions.licenses_helper import _extract_deb_license_list, rpm_licenses_scanner
+from actions import config_helper, data_helper
+from actions.data_helper import (
+    calculate_md5,
+    calculate_sha1,
+    read_data_from_json,
+    remove_duplicates,
+    save_data_to_json,
+    short_id,
+)
+from actions.licenses_helper import _extract_deb_license_list, _rpm_license_entry, rpm_licenses_scanner
 from actions.package import Package
 from actions.scanner import (
     iso_helper,
     docker_image_helper,
     gbt_sbom_helper,
     originators_helper,
+    package_files_helper,
     package_helper,
     relationships_helper,
     repo_helper,
@@ -433,20 +445,45 @@ class PackageScannerTests(unittest.TestCase):
             def __exit__(self, exc_type, exc, tb):
                 return False
 
+        fake_rpm = FakeRPM()
         with tempfile.NamedTemporaryFile() as pkg, \
-                mock.patch.object(package_helper.rpmfile, "open", return_value=FakeRPM()), \
-                mock.patch.object(package_helper, "rpm_files_scanner", return_value=[]):
+                mock.patch.object(package_helper.rpmfile, "open", return_value=fake_rpm) as rpm_open, \
+                mock.patch.object(package_helper, "rpm_files_scanner", return_value=[]) as files_scanner:
             pkg.write(b"fake rpm")
             pkg.flush()
             package, licenses, originators, provides = package_helper.process_rpm_package(
                 pkg.name, [])
 
+        self.assertIn("fileobj", rpm_open.call_args.kwargs)
+        files_scanner.assert_called_once_with(fake_rpm.headers)
+        self.assertEqual(package.checksum_value, hashlib.sha1(b"fake rpm").hexdigest())
+
         self.assertEqual(package.name, "demo")
         self.assertEqual(package.source, "demo-1.0.src.rpm")
         self.assertIn("libc.so.6", package.declared_dependencies)
         self.assertEqual(licenses[0]["name"], "MIT")
         self.assertIn("libdemo.so", provides["provides"])
 
+    def test_decode_header_list_keeps_order_and_handles_scalars(self):
+        self.assertEqual(
+            package_helper._decode_header_list([b"b", b"a", b"b"]), ["b", "a"])
+        self.assertEqual(package_helper._decode_header_list(b"only"), ["only"])
+        self.assertEqual(package_helper._decode_header_list(None), [])
+        self.assertEqual(package_helper._decode_header_list([b"", None, b"a"]), ["a"])
+
+    def test_rpm_files_scanner_reads_reused_headers(self):
+        headers = {
+            "dirnames": [b"/usr/bin/", b"/etc/"],
+            "basenames": [b"demo", b"demo.d", b"demo.conf"],
+            "dirindexes": [0, 1, 1],
+            "filemd5s": [b"abc", b"", b"def"],
+        }
+
+        files = package_files_helper.rpm_files_scanner(headers)
+
+        self.assertEqual([item["path"] for item in files], ["/usr/bin/demo", "/etc/demo.conf"])
+        self.assertEqual(files[1]["checksums"], {"algorithm": "MD5", "value": "def"})
+
 
 class RepoScannerTests(unittest.TestCase):
     def test_find_primary_xml_uses_repomd_location(self):
@@ -459,7 +496,7 @@ class RepoScannerTests(unittest.TestCase):
   </data>
 </repomd>"""
 
-        with mock.patch.object(repo_helper.requests, "get", return_value=Response()) as get:
+        with mock.patch.object(repo_helper.requests.Session, "get", return_value=Response()) as get:
             result = repo_helper.find_primary_xml_in_repo("https://example.test/repo/")
 
         self.assertEqual(result, "https://example.test/repo/repodata/primary.xml.gz")
@@ -482,7 +519,7 @@ class RepoScannerTests(unittest.TestCase):
             Response('<a href="primary.xml.gz">primary.xml.gz</a>'),
         ]
 
-        with mock.patch.object(repo_helper.requests, "get", side_effect=responses):
+        with mock.patch.object(repo_helper.requests.Session, "get", side_effect=responses):
             result = repo_helper.find_primary_xml_in_repo("https://example.test/repo/")
 
         self.assertEqual(result, "https://example.test/repo/repodata/primary.xml.gz")
@@ -490,7 +527,13 @@ class RepoScannerTests(unittest.TestCase):
     def test_fetch_and_extract_metadata_supports_gzip_and_zstd(self):
         class Response:
             def __init__(self, content):
-                self.content = content
+                self.raw = BytesIO(content)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
 
             def raise_for_status(self):
                 return None
@@ -498,15 +541,89 @@ class RepoScannerTests(unittest.TestCase):
         gz_buffer = BytesIO()
         with gzip.GzipFile(fileobj=gz_buffer, mode="wb") as gz:
             gz.write(b"metadata")
-        with mock.patch.object(repo_helper.requests, "get", return_value=Response(gz_buffer.getvalue())):
+        with mock.patch.object(repo_helper.requests.Session, "get", return_value=Response(gz_buffer.getvalue())):
             self.assertEqual(repo_helper._fetch_and_extract_metadata("https://x/primary.xml.gz"), b"metadata")
-            repo_helper.requests.get.assert_called_with(
-                "https://x/primary.xml.gz", timeout=repo_helper.REQUEST_TIMEOUT)
+            repo_helper.requests.Session.get.assert_called_with(
+                "https://x/primary.xml.gz", timeout=repo_helper.REQUEST_TIMEOUT, stream=True)
 
         compressed = zstandard.ZstdCompressor().compress(b"metadata-zst")
-        with mock.patch.object(repo_helper.requests, "get", return_value=Response(compressed)):
+        with mock.patch.object(repo_helper.requests.Session, "get", return_value=Response(compressed)):
             self.assertEqual(repo_helper._fetch_and_extract_metadata("https://x/primary.xml.zst"), b"metadata-zst")
 
+        primary = gzip.compress(b"""<metadata xmlns="http://linux.duke.edu/metadata/common">
+  <package type="rpm"><name>demo</name><arch>noarch</arch><version ver="1" rel="1"/>
+    <checksum type="sha256">abcdef0123456789</checksum>
+    <format><license xmlns="http://linux.duke.edu/metadata/rpm">MIT</license></format></package>
+</metadata>""")
+        with mock.patch.object(repo_helper.requests.Session, "get", return_value=Response(primary)), \
+                mock.patch.object(repo_helper, "read_data_from_json", return_value=[]), \
+                mock.patch.object(repo_helper, "save_data_to_json"):
+            sbom = repo_helper.rpm_repo_scanner(
+                "https://x/primary.xml.gz", "https://x/", "2026-06-16T00:00:00Z", True)
+        self.assertEqual([item["name"] for item in sbom["packages_sbom"]["packages"]], ["demo"])
+
+        truncated = gzip.compress(b"""<metadata xmlns="http://linux.duke.edu/metadata/common">
+  <package type="rpm"><name>demo</name><arch>noarch</arch><version ver="1" rel="1"/></package>
+  <package type="rpm"><name>broken""")
+        with mock.patch.object(repo_helper.requests.Session, "get", return_value=Response(truncated)), \
+                mock.patch.object(repo_helper, "read_data_from_json", return_value=[]), \
+                mock.patch.object(repo_helper, "save_data_to_json") as save_json:
+            with self.assertRaises(repo_helper.etree.XMLSyntaxError):
+                repo_helper.rpm_repo_scanner(
+                    "https://x/primary.xml.gz", "https://x/", "2026-06-16T00:00:00Z", True)
+        save_json.assert_not_called()
+
+    def test_get_session_is_per_thread(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sessions = list(executor.map(
+                lambda _: (repo_helper._get_session(), repo_helper._get_session()), range(2)))
+        main_session = repo_helper._get_session()
+
+        for first, second in sessions:
+            self.assertIs(first, second)
+            self.assertIsNot(first, main_session)
+
+    def test_parse_primary_xml_streams_rpm_packages(self):
+        xml_data = b"""<?xml version="1.0" encoding="UTF-8"?>
+<metadata xmlns="http://linux.duke.edu/metadata/common" xmlns:rpm="http://linux.duke.edu/metadata/rpm" packages="2">
+  <package type="rpm">
+    <name>demo</name>
+    <arch>x86_64</arch>
+    <version epoch="0" ver="1.2" rel="3.oe2203"/>
+    <checksum type="sha256" pkgid="YES">abcdef0123456789</checksum>
+    <description>demo package</description>
+    <url>https://example.test/demo</url>
+    <format>
+      <rpm:license>MIT</rpm:license>
+      <rpm:sourcerpm>demo-1.2-3.oe2203.src.rpm</rpm:sourcerpm>
+      <rpm:requires>
+        <rpm:entry name="libc.so.6()(64bit)"/>
+        <rpm:entry name="bash"/>
+      </rpm:requires>
+    </format>
+  </package>
+  <package type="rpm">
+    <name>other</name>
+    <arch>noarch</arch>
+    <version epoch="0" ver="2.0" rel="1"/>
+    <checksum type="sha256" pkgid="YES">fedcba9876543210</checksum>
+    <format>
+      <rpm:license>MIT</rpm:license>
+    </format>
+  </package>
+</metadata>"""
+
+        packages, licenses, _ = repo_helper._parse_primary_xml(BytesIO(xml_data), [], disable_tqdm=True)
+
+        self.assertEqual([package.name for package in packages], ["demo", "other"])
+        self.assertEqual(packages[0].version, "1.2")
+        self.assertEqual(packages[0].release, "3.oe2203")
+        self.assertEqual(packages[0].checksum_algorithm, "sha256")
+        self.assertEqual(packages[0].source, "demo-1.2-3.oe2203.src.rpm")
+        self.assertEqual(packages[0].declared_dependencies, ["libc.so.6()(64bit)", "bash"])
+        self.assertEqual(packages[1].arch, "noarch")
+        self.assertEqual([license["name"] for license in licenses], ["MIT"])
+
     def test_parse_sources_extracts_debian_source_package(self):
         source_data = b"""Package: demo
 Version: 1.2
@@ -552,6 +669,12 @@ class IsoScannerTests(unittest.TestCase):
         def close(self):
             self.closed = True
 
+    def setUp(self):
+        # 工作进程无法看到测试中的 mock，这里改用线程池执行同一套初始化与任务逻辑
+        patcher = mock.patch.object(iso_helper, "ProcessPoolExecutor", ThreadPoolExecutor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_select_iso_path_type_uses_ranked_fallback(self):
         class FakeIso:
             def has_udf(self):
@@ -631,6 +754,31 @@ class IsoScannerTests(unittest.TestCase):
         self.assertEqual(package_type, "rpm")
         self.assertEqual(result["packages_sbom"]["packages"][0]["package_type"], "rpm")
 
+    def test_scan_iso_merges_new_originators_from_workers_once(self):
+        entries = [
+            iso_helper.IsoEntry("/Packages/a.x86_64.rpm", "Packages/a.x86_64.rpm", "rockridge"),
+            iso_helper.IsoEntry("/Packages/b.x86_64.rpm", "Packages/b.x86_64.rpm", "rockridge"),
+        ]
+        reader = self.FakeIsoReader(entries)
+
+        def fake_process(path, originators):
+            name = Path(path).name
+            originators_helper.extract_originator_name("https://new.test", originators)
+            package = Package(name, "1.0", "1", "x86_64", "rpm", "SHA1", hashlib.sha1(name.encode()).hexdigest())
+            return package, [], originators, {"id": package.id, "provides": [name]}
+
+        with mock.patch.object(iso_helper, "PyCdlibIsoReader", return_value=reader), \
+                mock.patch.object(iso_helper, "read_data_from_json", return_value=[]), \
+                mock.patch.object(iso_helper, "save_data_to_json") as save_json, \
+                mock.patch.object(iso_helper, "process_rpm_package", side_effect=fake_process):
+            result, _ = iso_helper.scan_iso(
+                "demo.iso", "demo-1.0-x86_64.iso", "2026-06-16T00:00:00Z",
+                True, 2)
+
+        self.assertEqual(len(result["packages_sbom"]["packages"]), 2)
+        saved_originators = save_json.call_args.args[0]
+        self.assertEqual([item["homepage"] for item in saved_originators], ["https://new.test"])
+
     def test_scan_iso_without_packages_raises_existing_error(self):
         reader = self.FakeIsoReader([
             iso_helper.IsoEntry("/README.TXT", "README.TXT", "rockridge"),
@@ -681,6 +829,39 @@ class IsoScannerTests(unittest.TestCase):
             "loongarch64")
 
 
+class IsoProcessPoolTests(unittest.TestCase):
+    def test_scan_iso_packages_merges_worker_originators_across_processes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            deb_path = Path(tmpdir) / "demo.deb"
+            make_minimal_deb(deb_path)
+            iso_path = Path(tmpdir) / "demo.iso"
+            iso = pycdlib.PyCdlib()
+            iso.new(rock_ridge="1.09")
+            iso.add_directory("/POOL", rr_name="pool")
+            iso.add_file(str(deb_path), "/POOL/DEMO.DEB;1", rr_name="demo_1.0_amd64.deb")
+            iso.write(str(iso_path))
+            iso.close()
+
+            reader = iso_helper.PyCdlibIsoReader(str(iso_path))
+            try:
+                entries = reader.list_entries()
+            finally:
+                reader.close()
+            known = {"homepage": "https://known.test", "name": "Known", "is_organization": True,
+                     "file_analyzed": True}
+            originators = [known]
+
+            results = list(iso_helper._scan_iso_packages(
+                str(iso_path), entries, "deb", originators, True, 1))
+
+        self.assertEqual([entry.display_path for entry in entries], ["pool/demo_1.0_amd64.deb"])
+        self.assertEqual([package.name for package, _, _ in results], ["demo"])
+        self.assertEqual(results[0][1][0]["name"], "MIT")
+        self.assertEqual(
+            [originator["homepage"] for originator in originators],
+            ["https://known.test", "https://example.test/demo"])
+
+
 class DockerImageScannerTests(unittest.TestCase):
     def test_missing_tar_path_reports_chinese_error(self):
         with self.assertRaisesRegex(ValueError, "离线 Docker 镜像文件不存在"):
@@ -772,6 +953,32 @@ class DockerImageScannerTests(unittest.TestCase):
 
 
 class SourcePackageStrategyTests(unittest.TestCase):
+    def test_detect_from_archive_prefers_spec_then_control_then_nested(self):
+        def open_tar(members):
+            return tarfile.open(fileobj=BytesIO(make_tar_layer(members)))
+
+        with open_tar({"demo/debian/control": "Source: demo\n", "demo/demo.spec": "Name: demo\n"}) as tar:
+            self.assertEqual(src_package_helper._detect_from_archive(tar, 0), ("rpm", "Name: demo\n"))
+
+        nested = make_tar_layer({"demo/debian/control": "Source: nested\n"})
+        with open_tar({"demo.tar": nested, "README": "demo\n"}) as tar:
+            self.assertEqual(src_package_helper._detect_from_archive(tar, 0), ("deb", "Source: nested\n"))
+
+        with open_tar({"a.tar.gz": "not an archive\n", "b.zip": nested}) as tar:
+            self.assertEqual(src_package_helper._detect_from_archive(tar, 0), ("deb", "Source: nested\n"))
+        zip_buffer = BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w") as zf:
+            zf.writestr("demo.tar", nested)
+        with zipfile.ZipFile(zip_buffer) as zf:
+            self.assertEqual(src_package_helper._detect_from_zip(zf, 0), ("deb", "Source: nested\n"))
+        self.assertEqual(src_package_helper._sniff_archive_format(b"PK\x03\x04data"), "zip")
+        self.assertEqual(src_package_helper._sniff_archive_format(b"\x1f\x8bdata"), "tar")
+        self.assertEqual(src_package_helper._sniff_archive_format(b"plain text"), "")
+
+        with open_tar({"a/README": "demo\n", "b/demo.spec": "Name: demo\n"}) as tar:
+            with mock.patch.object(src_package_helper, "ARCHIVE_DETECT_MAX_MEMBERS", 1):
+                self.assertEqual(src_package_helper._detect_from_archive(tar, 0), ("other", ""))
+
     def test_dsc_source_package_returns_package_object(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             dsc_path = Path(tmpdir) / "demo_1.0.dsc"
@@ -796,11 +1003,13 @@ class SourcePackageStrategyTests(unittest.TestCase):
             tar_path = Path(tmpdir) / "debdemo.tar.gz"
             with tarfile.open(tar_path, "w:gz") as tar:
                 tar.add(control_path, arcname="debdemo/debian/control")
+            expected_md5 = hashlib.md5(tar_path.read_bytes()).hexdigest()
 
             package, licenses, originators = src_package_helper.process_src_package(
                 str(tar_path), [])
 
         self.assertEqual(package.name, "debdemo")
+        self.assertEqual(package.checksum_value, expected_md5)
         self.assertIn("debhelper", package.declared_dependencies)
         self.assertEqual(licenses, [])
 
@@ -825,8 +1034,11 @@ Release: 2
 License: MIT
 URL: https://example.test/specdemo
 Requires: python3, libc >= 2.0
+Requires: %{name}-libs = %{version}
 %description
 Spec demo package
+%package devel
+Requires: specdemo-headers
 """
         package, licenses, originators = src_package_helper._process_spec(
             spec, "abc123", [])
@@ -835,6 +1047,8 @@ Spec demo package
         self.assertEqual(package.version, "1.0")
         self.assertIn("python3", package.declared_dependencies)
         self.assertIn("libc >= 2.0", package.declared_dependencies)
+        self.assertIn("specdemo-libs = 1.0", package.declared_dependencies)
+        self.assertNotIn("specdemo-headers", package.declared_dependencies)
         self.assertEqual(licenses[0]["name"], "MIT")
         self.assertEqual(originators[0]["homepage"], "https://example.test/specdemo")
 
@@ -869,6 +1083,20 @@ class RelationshipAndMetadataTests(unittest.TestCase):
             relationships_helper.get_rpm_relationships(packages, provides, disable_tqdm=True),
             [{"id": "Package-app", "related_element": "Package-lib", "relationship_type": "DEPENDS_ON"}])
 
+    def test_rpm_relationships_keep_provider_order_and_skip_self(self):
+        packages = [{"id": "Package-app", "depends": ["libbar", "libfoo", "app-cap"]}]
+        provides = [
+            {"id": "Package-lib", "provides": ["libfoo", "libbar"]},
+            {"id": "Package-alt", "provides": ["libbar"]},
+            {"id": "Package-app", "provides": ["app-cap"]},
+            {"id": "Package-lib", "provides": ["libbar", "libfoo"]},
+        ]
+
+        relationships = relationships_helper.get_rpm_relationships(packages, provides, disable_tqdm=True)
+
+        self.assertEqual(
+            [item["related_element"] for item in relationships], ["Package-lib", "Package-alt"])
+
     def test_package_json_and_file_relationships(self):
         package = Package("demo", "1.0", "1", "x86_64", "rpm", "SHA1", "abcdef123456")
         package.add_file({"id": "File-demo", "name": "demo", "path": "/usr/bin/demo"})
@@ -884,10 +1112,37 @@ class RelationshipAndMetadataTests(unittest.TestCase):
             "https://example.test", originators)
         self.assertEqual((name, is_org, updated), ("Example", True, originators))
 
+        originators_helper.extract_originator_name("https://new.test", originators)
+        originators.append({"homepage": "https://later.test", "name": "Later", "is_organization": False})
+        self.assertEqual(
+            originators_helper.extract_originator_name("https://later.test", originators)[:2], ("Later", False))
+        originators_helper.extract_originator_name("https://new.test", originators)
+        self.assertEqual([item["homepage"] for item in originators].count("https://new.test"), 1)
+
         suppliers = suppliers_helper.get_suppliers(
             "demo.el9", "https://upstream.test", "Upstream", suppliers_helper.RPM_SUPPLIERS)
         self.assertEqual(suppliers[0]["name"], "Red Hat Enterprise Linux")
         self.assertEqual(suppliers[-1]["name"], "Upstream")
+        self.assertEqual([supplier["tier"] for supplier in suppliers], [1, 2])
+        self.assertEqual(
+            suppliers_helper.get_suppliers("demo.fc40", "https://upstream.test", "Upstream", suppliers_helper.RPM_SUPPLIERS),
+            [{"name": "Upstream", "tier": 1, "link": "https://upstream.test"}])
+        self.assertEqual(
+            suppliers_helper.get_suppliers("other.el9", None, None, suppliers_helper.RPM_SUPPLIERS),
+            [suppliers[0]])
+        supplier_dicts = [
+            {"keywords": [".el"], "name": "First", "url": "https://first.test"},
+            {"keywords": ["linx", ".e"], "name": "Second", "url": "https://second.test"},
+        ]
+        self.assertEqual(
+            suppliers_helper._match_direct_supplier("1.linx.el8", supplier_dicts), ("First", "https://first.test"))
+        self.assertEqual(
+            suppliers_helper._match_direct_supplier("1.ex", supplier_dicts), ("Second", "https://second.test"))
+        self.assertEqual(suppliers_helper._match_direct_supplier("1.fc", supplier_dicts), ("1.fc", None))
+        self.assertEqual(suppliers_helper._match_direct_supplier("", supplier_dicts), ("", None))
+        self.assertEqual(
+            suppliers_helper._match_direct_supplier("1.el8", list(reversed(supplier_dicts))),
+            ("Second", "https://second.test"))
 
     def test_data_helpers_and_license_extraction(self):
         with tempfile.NamedTemporaryFile() as f:
@@ -896,11 +1151,65 @@ class RelationshipAndMetadataTests(unittest.TestCase):
             self.assertEqual(calculate_md5(f), "5d41402abc4b2a76b9719d911017c592")
             f.seek(0)
             self.assertEqual(calculate_sha1(f), "aaf4c61ddcc5e8a2dabede0f3b482cd9aea9434d")
+            self.assertEqual(calculate_sha1(f.name), "aaf4c61ddcc5e8a2dabede0f3b482cd9aea9434d")
+            self.assertEqual(calculate_md5(BytesIO(b"hello")), "5d41402abc4b2a76b9719d911017c592")
 
         self.assertEqual(remove_duplicates([{"id": "a"}, {"id": "a"}, {"id": "b"}]), [{"id": "a"}, {"id": "b"}])
+        self.assertEqual(
+            remove_duplicates([{"id": "a", "v": 1}, {"id": "b"}, {"id": "a", "v": 2}]),
+            [{"id": "a", "v": 1}, {"id": "b"}])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / "data.json"
+            save_data_to_json([{"name": "凌霄", "count": 1}], str(json_path))
+            self.assertIn("凌霄", json_path.read_text(encoding="utf-8"))
+            self.assertEqual(read_data_from_json(str(json_path)), [{"name": "凌霄", "count": 1}])
+            with self.assertRaises(TypeError):
+                save_data_to_json([object()], str(json_path))
+            self.assertEqual(read_data_from_json(str(json_path)), [{"name": "凌霄", "count": 1}])
+            self.assertEqual([item.name for item in Path(temp_dir).iterdir()], ["data.json"])
+
         self.assertEqual(rpm_licenses_scanner("MIT")[0]["name"], "MIT")
+        self.assertEqual(
+            rpm_licenses_scanner("GPLv2+ and (mit or ASL 2.0)")[0]["name"],
+            "GPL-2.0-or-later and (MIT or Apache-2.0)")
         self.assertIn("GPL-2.0-only", _extract_deb_license_list("See /usr/share/common-licenses/GPL-2.0."))
 
+    def test_save_data_to_json_keeps_existing_file_mode(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / "data.json"
+            save_data_to_json({"a": 1}, str(json_path))
+            self.assertEqual(json_path.stat().st_mode & 0o777, data_helper.NEW_FILE_MODE)
+
+            json_path.chmod(0o640)
+            with mock.patch.object(data_helper.tempfile, "NamedTemporaryFile",
+                                   wraps=data_helper.tempfile.NamedTemporaryFile) as named_temp:
+                save_data_to_json({"a": 2}, str(json_path))
+
+            self.assertEqual(json_path.stat().st_mode & 0o777, 0o640)
+            self.assertEqual(read_data_from_json(str(json_path)), {"a": 2})
+            self.assertEqual(named_temp.call_args.kwargs["dir"], temp_dir)
+            self.assertEqual([item.name for item in Path(temp_dir).iterdir()], ["data.json"])
+
+    def test_short_id_is_not_flagged_for_security_use(self):
+        expected = hashlib.md5(b"usr/bin/demo").hexdigest()[:12]
+        with mock.patch("actions.data_helper.hashlib.md5", wraps=hashlib.md5) as md5:
+            self.assertEqual(short_id("usr/bin/demo"), expected)
+
+        md5.assert_called_once_with(b"usr/bin/demo", usedforsecurity=False)
+
+    def test_rpm_licenses_scanner_caches_entries_without_sharing_dicts(self):
+        _rpm_license_entry.cache_clear()
+        self.addCleanup(_rpm_license_entry.cache_clear)
+
+        first = rpm_licenses_scanner("GPLv2+")
+        second = rpm_licenses_scanner("GPLv2+")
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first[0], second[0])
+        cache_info = _rpm_license_entry.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (1, 1))
+        self.assertIsNotNone(cache_info.maxsize)
+
 
 class SPDXConversionTests(unittest.TestCase):
     def test_convert_to_spdx_includes_files_licenses_and_relationships(self):
@@ -1279,6 +1588,8 @@ class GBTConversionTests(unittest.TestCase):
         self.assertIn("宽松许可证", apache["riskDescription"])
 
     def test_gbt_license_risk_has_non_commercial_description(self):
+        gbt_sbom_helper._load_license_categories.cache_clear()
+        self.addCleanup(gbt_sbom_helper._load_license_categories.cache_clear)
         with mock.patch.object(gbt_sbom_helper, "read_data_from_json",
                                return_value=[{
                                    "spdx_license_key": "LicenseRef-test",
@@ -1384,6 +1695,27 @@ class ScanCodeHelperTests(unittest.TestCase):
     def test_include_pattern_does_not_prune_directories(self):
         self.assertFalse(scancode_helper._should_skip_directory("src", ["*.py"]))
         self.assertTrue(scancode_helper._should_skip_directory("test", ["test"]))
+        self.assertTrue(scancode_helper._should_skip_directory("pkg/vendor", ["*/vendor/*"]))
+        self.assertTrue(scancode_helper._should_skip_directory("docs", ["docs/**"]))
+        self.assertFalse(scancode_helper._should_skip_directory("pkg/vendored", ["*/vendor/*"]))
+
+    def test_iter_source_files_prunes_only_excluded_directories(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for relative_path in ("src/main.c", "src/sub/util.py", "test/main_test.c", ".git/config", "README"):
+                path = Path(tmpdir) / relative_path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("demo\n")
+
+            files = scancode_helper._iter_source_files(tmpdir, None, ["test", "*.md"])
+            relative_files = sorted(Path(path).relative_to(tmpdir).as_posix() for path in files)
+            with mock.patch.object(scancode_helper.os, "scandir", wraps=scancode_helper.os.scandir) as scandir:
+                vcs_excluded = sorted(
+                    Path(path).relative_to(tmpdir).as_posix()
+                    for path in scancode_helper._iter_source_files(tmpdir, None, [".git/*"]))
+
+        self.assertEqual(relative_files, [".git/config", "README", "src/main.c", "src/sub/util.py"])
+        self.assertEqual(vcs_excluded, ["README", "src/main.c", "src/sub/util.py", "test/main_test.c"])
+        self.assertNotIn(str(Path(tmpdir) / ".git"), [call.args[0] for call in scandir.call_args_list])
 
     def test_extract_source_archive_skips_path_traversal(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1405,6 +1737,158 @@ class ScanCodeHelperTests(unittest.TestCase):
                         path.rmdir()
                 Path(source_dir).rmdir()
 
+    def test_extract_src_rpm_streams_inner_source_archive(self):
+        inner = BytesIO()
+        with tarfile.open(fileobj=inner, mode="w:gz") as tar:
+            add_tar_member(tar, "demo-1.0/src/main.c", "int main(void) { return 0; }\n")
+            add_tar_member(tar, "../evil.c", "bad\n")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src_rpm_path = Path(tmpdir) / "demo.src.tar"
+            with tarfile.open(src_rpm_path, "w") as outer:
+                add_tar_member(outer, "demo.spec", "Name: demo\n")
+                add_tar_member(outer, "demo-1.0.tar.gz", inner.getvalue())
+
+            source_dir = scancode_helper._extract_src_rpm(str(src_rpm_path))
+            try:
+                self.assertEqual(
+                    (Path(source_dir) / "demo-1.0" / "src" / "main.c").read_text(),
+                    "int main(void) { return 0; }\n")
+                self.assertFalse((Path(source_dir).parent / "evil.c").exists())
+            finally:
+                shutil.rmtree(source_dir)
+
+    def test_process_member_only_runs_scancode_on_license_candidates(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plain = Path(tmpdir) / "plain.c"
+            plain.write_text("int main(void) { return 0; }\n")
+            binary = Path(tmpdir) / "blob.bin"
+            binary.write_bytes(b"\0copyright")
+            noticed = Path(tmpdir) / "notice.c"
+            noticed.write_text("/* Copyright 2024 Demo */\n")
+
+            with mock.patch.object(scancode_helper.scancode, "get_licenses", return_value={}) as get_licenses, \
+                    mock.patch.object(scancode_helper.scancode, "get_copyrights", return_value={}):
+                results = [
+                    scancode_helper._process_member((tmpdir, str(path), path.stat().st_size, None))
+                    for path in (plain, binary, noticed)
+                ]
+
+        get_licenses.assert_called_once_with(location=str(noticed), include_text=True)
+        self.assertEqual([file_info["path"] for file_info, _ in results], ["plain.c", "blob.bin", "notice.c"])
+        self.assertEqual(results[0][0]["licenses"], [])
+
+    def test_archive_entry_stream_reads_across_block_boundaries(self):
+        stream = scancode_helper._ArchiveEntryStream(iter([b"abc", b"", b"defgh"]))
+
+        self.assertEqual(stream.read(2), b"ab")
+        self.assertEqual(stream.read(4), b"c")
+        self.assertEqual(stream.read(4), b"defg")
+        self.assertEqual(stream.read(), b"h")
+        self.assertEqual(stream.read(1), b"")
+
+    def test_needs_license_scan_reads_large_files_in_chunks(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            boundary = Path(tmpdir) / "boundary.c"
+            boundary.write_bytes(
+                b"x" * (scancode_helper.BINARY_SNIFF_SIZE + scancode_helper.LICENSE_HINT_CHUNK_SIZE - 4)
+                + b"Copyright 2024 Demo\n")
+            plain = Path(tmpdir) / "plain.c"
+            plain.write_bytes(b"x" * (scancode_helper.LICENSE_HINT_CHUNK_SIZE * 2))
+
+            with mock.patch.object(scancode_helper, "LICENSE_HINT_RE",
+                                   wraps=scancode_helper.LICENSE_HINT_RE) as hint_re:
+                self.assertTrue(scancode_helper._needs_license_scan(str(boundary)))
+                self.assertFalse(scancode_helper._needs_license_scan(str(plain)))
+
+        searched_sizes = [len(call.args[0]) for call in hint_re.search.call_args_list]
+        self.assertLessEqual(
+            max(searched_sizes),
+            scancode_helper.LICENSE_HINT_CHUNK_SIZE + scancode_helper.LICENSE_HINT_OVERLAP)
+
+    def test_batch_members_schedules_largest_files_first(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            members = []
+            for size in range(20):
+                path = Path(tmpdir) / f"file{size}.c"
+                path.write_bytes(b"x" * size)
+                members.append((tmpdir, str(path), size, None))
+
+            with mock.patch.object(scancode_helper.os.path, "getsize") as getsize:
+                batches = scancode_helper._batch_members(members, workers=1)
+
+        getsize.assert_not_called()
+        self.assertEqual(batches[0], [(tmpdir, str(Path(tmpdir) / "file19.c"), 19, None)])
+        self.assertTrue(all(len(batch) == 1 for batch in batches[:8]))
+        self.assertEqual(len(batches[8]), 2)
+        self.assertCountEqual([member for batch in batches for member in batch], members)
+
+    def test_group_duplicate_members_scans_identical_files_once(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for relative_path, content in (
+                    ("a/LICENSE", "MIT License\n"), ("b/LICENSE", "MIT License\n"), ("c/LICENSE", "BSD License\n")):
+                path = Path(tmpdir) / relative_path
+                path.parent.mkdir(parents=True)
+                path.write_text(content)
+            members = [
+                (tmpdir, str(Path(tmpdir) / name), 12, None) for name in ("a/LICENSE", "b/LICENSE", "c/LICENSE")]
+
+            with mock.patch.object(scancode_helper, "calculate_md5",
+                                   wraps=scancode_helper.calculate_md5) as md5:
+                unique_members, duplicates = scancode_helper._group_duplicate_members(members)
+
+        mit_md5 = hashlib.md5(b"MIT License\n").hexdigest()
+        self.assertCountEqual(
+            unique_members, [members[2], (tmpdir, members[0][1], 12, mit_md5)])
+        self.assertEqual(duplicates, {"a/LICENSE": [(tmpdir, members[1][1], 12, mit_md5)]})
+        # 大小相同但文件头不同的文件无需计算完整 MD5
+        self.assertCountEqual([call.args[0] for call in md5.call_args_list], [members[0][1], members[1][1]])
+
+        file_info = {
+            "id": "File-LICENSE-a", "name": "LICENSE", "path": "a/LICENSE", "licenses": ["LicenseRef-mit"],
+            "holders": [], "checksums": {"algorithm": "MD5", "value": "abc"},
+        }
+        copied = scancode_helper._copy_file_info(file_info, members[1])
+        self.assertEqual(copied["path"], "b/LICENSE")
+        self.assertNotEqual(copied["id"], file_info["id"])
+        self.assertEqual(copied["licenses"], ["LicenseRef-mit"])
+        self.assertIsNot(copied["licenses"], file_info["licenses"])
+
+    def test_scan_src_dir_processes_copies_when_representative_fails(self):
+        process_member = scancode_helper._process_member
+        mit_md5 = hashlib.md5(b"MIT License\n").hexdigest()
+        failed_paths = []
+
+        def fail_representative(member):
+            if member[3] == mit_md5 and not failed_paths:
+                failed_paths.append(member[1])
+                return None, []
+            return process_member(member)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for relative_path, content in (
+                    ("a/LICENSE", "MIT License\n"), ("b/LICENSE", "MIT License\n"), ("c/LICENSE", "BSD License\n")):
+                path = Path(tmpdir) / relative_path
+                path.parent.mkdir(parents=True)
+                path.write_text(content)
+
+            with mock.patch.object(scancode_helper, "Pool", ThreadPool), \
+                    mock.patch.object(scancode_helper, "tqdm") as progress_bar, \
+                    mock.patch.object(scancode_helper, "_process_member", side_effect=fail_representative), \
+                    mock.patch.object(scancode_helper, "calculate_md5",
+                                      wraps=scancode_helper.calculate_md5) as md5, \
+                    mock.patch.object(scancode_helper.scancode, "get_licenses", return_value={}), \
+                    mock.patch.object(scancode_helper.scancode, "get_copyrights", return_value={}):
+                files, _ = scancode_helper.scan_src_dir(tmpdir, None, None, 2, True)
+
+        scanned_paths = [str(Path(tmpdir) / file_info["path"]) for file_info in files]
+        self.assertEqual(len(scanned_paths), 2)
+        self.assertIn(str(Path(tmpdir) / "c/LICENSE"), scanned_paths)
+        self.assertNotIn(failed_paths[0], scanned_paths)
+        self.assertEqual(md5.call_count, 3)
+        progress = progress_bar.return_value.__enter__.return_value
+        self.assertEqual(sum(call.args[0] for call in progress.update.call_args_list), 3)
+
     def test_run_osv_dependency_scan_missing_binary_returns_empty(self):
         with tempfile.TemporaryDirectory() as tmpdir, \
                 mock.patch.object(scancode_helper, "OSV_SCANNER", str(Path(tmpdir) / "missing")):